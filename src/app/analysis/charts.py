@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Canonical series plus friendly fallbacks if canonical is absent
@@ -62,15 +63,26 @@ def build_pollutant_chart(df: pd.DataFrame, mapping: Optional[dict] = None) -> D
     if "timestamp" not in df.columns or len(df) == 0:
         return {"pollutants": []}
 
+    # Resolve the series columns up front so only those columns are touched and
+    # the timestamp formatting pass is skipped entirely when nothing matches.
+    selected: List[Tuple[str, str, str]] = []
+    for key, canonical, unit, falls, kws in _SERIES:
+        col = _pick_column(df, canonical, mapping, falls, kws)
+        if col:
+            selected.append((key, unit, col))
+    if not selected:
+        return {"pollutants": []}
+
     ts = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
     t_iso = ts.dt.strftime("%Y-%m-%dT%H:%M:%SZ").tolist()
 
     out: List[Dict] = []
-    for key, canonical, unit, falls, kws in _SERIES:
-        col = _pick_column(df, canonical, mapping, falls, kws)
-        if col:
-            y = pd.to_numeric(df[col], errors="coerce").astype(float)
-            y = y.where(y.notna(), None).tolist()
-            out.append({"key": key, "unit": unit, "t": t_iso, "y": y})
+    for key, unit, col in selected:
+        values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+        # Mask NaNs on the object copy so tolist() emits None without a Python loop.
+        boxed = values.astype(object)
+        boxed[np.isnan(values)] = None
+        y = boxed.tolist()
+        out.append({"key": key, "unit": unit, "t": t_iso, "y": y})
 
     return {"pollutants": out}
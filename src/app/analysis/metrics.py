@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Any, Dict, Literal, Mapping
 
@@ -103,7 +104,9 @@ def _per_km_value(rate: pd.Series, dt_s: pd.Series, dist_m: pd.Series, mask: pd.
     return value
 
 
+@functools.lru_cache(maxsize=None)
 def _output_unit(defn: MetricDef) -> str:
+    # ``MetricDef`` is frozen, so the derived unit is cached per definition.
     numerator, *_ = defn.si_unit.split("/")
     return f"{numerator}/km"
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 import pathlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse, Response
-from fastapi.staticfiles import StaticFiles
 
 from src.app.api.routes import report as report_routes
 from src.app.ui.routes import analyze as analyze_routes
@@ -17,8 +19,28 @@ from src.app.ui.routes import report as report_view_routes
 from src.app.ui.routes import results as results_routes
 from src.app.ui.routes import samples as samples_routes
 from src.app.ui.server import router as ui_router
+from src.app.ui.server import warm_page_caches
+from src.app.ui.static_files import PrecompressedStaticFiles
 
-app = FastAPI(title="RDE MVP")
+logger = logging.getLogger(__name__)
+
+
+def _warm_caches() -> None:
+    """Populate the process-wide caches so the first request does not pay for them."""
+
+    try:
+        warm_page_caches()
+    except Exception:  # pragma: no cover - warm-up is best effort
+        logger.warning("Cache warm-up failed", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    _warm_caches()
+    yield
+
+
+app = FastAPI(title="RDE MVP", lifespan=lifespan)
 
 
 @app.get("/health")
@@ -51,7 +73,7 @@ app.include_router(print_preview_routes.router)
 
 # Expose static assets (CSS/JS) used by the Tailwind/HTMX UI.
 static_dir = pathlib.Path(__file__).resolve().parent.parent / "ui" / "static"
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+app.mount("/static", PrecompressedStaticFiles(directory=str(static_dir)), name="static")
 
 
 __all__ = ["app", "health"]
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 
-from src.app.reporting.eu7ld_report import apply_guardrails, load_report
+from src.app.reporting.eu7ld_report import load_report
 from src.app.reporting.schemas import ReportData
 
 
@@ -13,7 +14,7 @@ router = APIRouter(prefix="/api/report", tags=["report"])
 
 
 @router.get("/{test_id}", response_model=ReportData)
-def get_report(test_id: str) -> ReportData:
+def get_report(test_id: str) -> Response:
     """Return the conformity report associated with ``test_id``."""
 
     try:
@@ -24,7 +25,13 @@ def get_report(test_id: str) -> ReportData:
         raise HTTPException(status_code=422, detail="Report is invalid") from exc
     except Exception as exc:  # pragma: no cover - consistent error surface
         raise HTTPException(status_code=422, detail="Report is invalid") from exc
-    return apply_guardrails(report)
+    # ``load_report`` already returns a guarded copy. Serialize with pydantic-core
+    # directly; ``response_model`` still documents the schema but FastAPI skips
+    # re-validation and ``jsonable_encoder``.
+    return Response(
+        content=report.model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
 
 
 __all__ = ["router"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
@@ -10,10 +11,13 @@ import numpy as np
 import pandas as pd
 
 from src.app.analysis.metrics import compute_distance_normalized_kpis
+from src.app.utils import sort_by_timestamp
 
 from .rules import AnalysisRules, SpeedBin
 
 _SPEED_COL_CANDIDATES = ("veh_speed_m_s", "speed_m_s")
+# ``\w`` is Unicode-aware and matches exactly ``str.isalnum()`` plus ``_``.
+_UNSAFE_BIN_CHARS = re.compile(r"[^\w-]")
 
 
 @dataclass(slots=True)
@@ -48,11 +52,7 @@ class AnalysisEngine:
         )
 
     def _sanitize_bin_name(self, bin_name: str) -> str:
-        safe = [
-            ch if ch.isalnum() or ch in ("_", "-") else "_"
-            for ch in bin_name.strip().lower()
-        ]
-        return "bin_mask__" + "".join(safe)
+        return "bin_mask__" + _UNSAFE_BIN_CHARS.sub("_", bin_name.strip().lower())
 
     def analyze(self, fused: pd.DataFrame) -> AnalysisResult:
         """Compute KPIs, validity checks and a Markdown summary."""
@@ -78,12 +78,16 @@ class AnalysisEngine:
             summary = "# Analysis Summary\n\nNo data available."
             return AnalysisResult(derived=derived, analysis=analysis, summary_md=summary)
 
-        df = fused.copy()
+        # Fused frames are usually already time-ordered, in which case the sort is
+        # skipped. ``derived`` is handed back to the caller, so it must not share
+        # column buffers with ``fused``.
+        df = sort_by_timestamp(fused, self.timestamp_col)
+        if df is fused:
+            df = fused.copy()
         try:
             df.attrs = dict(getattr(fused, "attrs", {}))
         except AttributeError:
             df.attrs = {}
-        df = df.sort_values(self.timestamp_col).reset_index(drop=True)
 
         ts = pd.to_datetime(df[self.timestamp_col], utc=True, errors="coerce")
         if ts.isna().any():
@@ -25,7 +25,11 @@ class FusionEngine:
         ts = synthesize_timestamps(spec)
         df = spec.df.copy()
         df[ts.name] = ts
-        return df.sort_values(ts.name)
+        # Reader output is already time-ordered; only sort (stably) when needed.
+        # ``merge_asof`` preserves the left order, so the fused frame stays sorted.
+        if ts.is_monotonic_increasing:
+            return df
+        return df.sort_values(ts.name, kind="mergesort")
 
     def _apply_offset_estimate(
         self,
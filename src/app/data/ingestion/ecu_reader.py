@@ -5,13 +5,13 @@ from __future__ import annotations
 import csv
 import io
 from collections.abc import Mapping
-from typing import Any
+from typing import IO, Any
 
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_numeric_dtype
 
-from src.app.utils import to_utc_series
+from src.app.utils import sort_by_timestamp, to_utc_series
 
 ORDERED = [
     "timestamp",
@@ -20,6 +20,7 @@ ORDERED = [
     "engine_load_pct",
     "throttle_pct",
 ]
+_NUMERIC_COLUMNS = frozenset(ORDERED[1:])
 
 DEFAULT_MAPPING: Mapping[str, str] = {
     "timestamp": "timestamp",
@@ -64,7 +65,7 @@ def _ensure_timestamp(df: pd.DataFrame, *, start: pd.Timestamp) -> pd.DataFrame:
     if "timestamp" in df.columns:
         ts = df["timestamp"]
         if is_numeric_dtype(ts):
-            df = df.copy()
+            df = df.copy(deep=False)
             offsets = pd.to_timedelta(ts.to_numpy(), unit="s")
             df["timestamp"] = start + offsets
         return df
@@ -97,15 +98,15 @@ def _normalize(df: pd.DataFrame) -> pd.DataFrame:
     if "timestamp" not in df.columns:
         raise ValueError("ECU data requires a 'timestamp' column.")
 
-    df = df.copy()
+    df = df.copy(deep=False)
     df["timestamp"] = to_utc_series(df["timestamp"])
-    df = df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+    df = sort_by_timestamp(df)
 
-    available: list[str] = ["timestamp"]
-    for column in ORDERED[1:]:
-        if column in df.columns:
+    present = _NUMERIC_COLUMNS.intersection(df.columns)
+    for column in present:
+        if not is_numeric_dtype(df[column]):
             df[column] = pd.to_numeric(df[column], errors="coerce")
-            available.append(column)
+    available = ["timestamp", *(column for column in ORDERED[1:] if column in present)]
 
     return df[available].copy()
 
@@ -153,13 +154,15 @@ class ECUReader:
         return _normalize(df)
 
 
-def read_ecu_csv(text: str) -> list[dict[str, str]]:
-    """Parse ECU CSV *text* into raw dictionaries."""
+def read_ecu_csv(text: str | IO[str]) -> list[dict[str, str]]:
+    """Parse ECU CSV *text* (a string or an open text stream) into raw dictionaries."""
 
-    if not text or not text.strip():
-        return []
+    if isinstance(text, str):
+        if not text.strip():
+            return []
+        text = io.StringIO(text)
 
-    reader = csv.DictReader(io.StringIO(text))
+    reader = csv.DictReader(text)
     return [dict(row) for row in reader]
 
 
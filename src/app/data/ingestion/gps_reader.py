@@ -6,26 +6,33 @@ import csv
 import datetime as dt
 import io
 import math
-from typing import Mapping
+from typing import IO, Mapping
 
 import gpxpy
 import numpy as np
 import pandas as pd
 import pynmea2
+from pandas.api.types import is_numeric_dtype
 
-from src.app.utils import to_utc_series
+from src.app.utils import sort_by_timestamp, to_utc_series
 
 ORDERED = ["timestamp", "lat", "lon", "alt_m", "speed_m_s", "hdop", "fix_ok"]
+_NUMERIC_COLUMNS = ("lat", "lon", "alt_m", "speed_m_s", "hdop")
+_REQUIRED_COLUMNS = frozenset({"timestamp", "lat", "lon"})
 
 
-def read_gps_csv(text: str) -> list[dict[str, str]]:
-    """Return raw GPS rows parsed from CSV *text*."""
+def read_gps_csv(text: str | IO[str]) -> list[dict[str, str]]:
+    """Return raw GPS rows parsed from CSV *text* (a string or an open text stream)."""
 
-    if not text or not text.strip():
-        return []
+    if isinstance(text, str):
+        if not text.strip():
+            return []
+        text = io.StringIO(text)
 
-    reader = csv.DictReader(io.StringIO(text))
+    reader = csv.DictReader(text)
     return [dict(row) for row in reader]
+
+
 def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Return the great-circle distance between two WGS84 coordinates in metres."""
 
@@ -71,6 +78,20 @@ def _anti_teleport(df: pd.DataFrame, threshold_m: float = 150.0) -> pd.Series:
     return pd.Series(jump, index=df.index)
 
 
+def _has_any_value(series: pd.Series) -> bool:
+    """Return ``True`` if *series* holds at least one non-null value.
+
+    Populated columns are the common case, so the first element is checked
+    before falling back to a full ``notna`` scan.
+    """
+
+    if series.empty:
+        return False
+    if pd.notna(series.iat[0]):
+        return True
+    return bool(series.notna().any())
+
+
 def _coerce_bool(val: object) -> float | bool:
     if pd.isna(val):
         return np.nan
@@ -200,19 +221,19 @@ def _normalize(df: pd.DataFrame) -> pd.DataFrame:
             }
         )[ORDERED].copy()
 
-    required = {"timestamp", "lat", "lon"}
-    if not required.issubset(df.columns):
-        missing = ", ".join(sorted(required - set(df.columns)))
+    missing_fields = _REQUIRED_COLUMNS.difference(df.columns)
+    if missing_fields:
+        missing = ", ".join(sorted(missing_fields))
         raise ValueError(f"Required GPS fields missing: {missing}.")
 
-    df = df.copy()
+    df = df.copy(deep=False)
     df["timestamp"] = to_utc_series(df["timestamp"])
-    df = df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+    df = sort_by_timestamp(df)
 
-    numeric_cols = ["lat", "lon", "alt_m", "speed_m_s", "hdop"]
-    for col in numeric_cols:
+    for col in _NUMERIC_COLUMNS:
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+            if not is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors="coerce")
         else:
             df[col] = np.nan
 
@@ -221,7 +242,7 @@ def _normalize(df: pd.DataFrame) -> pd.DataFrame:
     else:
         df["fix_ok"] = np.nan
 
-    if df["speed_m_s"].isna().all():
+    if not _has_any_value(df["speed_m_s"]):
         df["speed_m_s"] = _derive_speed(df)
 
     jumps = _anti_teleport(df)
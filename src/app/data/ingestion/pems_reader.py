@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import csv
 import io
+import os
 from collections.abc import Mapping
+from typing import IO
 
-import numpy as np
 import pandas as pd
 from pandas.api.types import is_numeric_dtype
 from pint.errors import DimensionalityError, UndefinedUnitError
@@ -20,12 +21,18 @@ from src.app.data.schemas import (
     PEMSConfig,
 )
 from src.app.utils import (
-    normalize_exhaust_flow,
-    normalize_massflow,
-    normalize_temperature,
+    convert_array,
+    sort_by_timestamp,
     to_utc_series,
 )
 
+try:  # pragma: no cover - optional dependency guard
+    import pyarrow  # type: ignore  # noqa: F401
+
+    _PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - default C parser is used instead
+    _PYARROW_AVAILABLE = False
+
 ORDERED: list[str] = list(CORE_REQUIRED) + list(GASES_OPTIONAL) + list(PARTICLE_OPTIONAL) + list(AUX_OPTIONAL)
 
 _TEMPERATURE_COLUMNS = {"temp_c", "exhaust_temp_c", "amb_temp_c"}
@@ -42,6 +49,8 @@ _MASSFLOW_COLUMNS = {
     "pm_mg_s",
 }
 _EXHAUST_FLOW_COLUMNS = {"exhaust_flow_kg_s"}
+_NUMERIC_COLUMNS = frozenset(ORDERED) - {"timestamp"}
+_TIMESTAMP_DTYPE = pd.DatetimeTZDtype("ns", "UTC")
 
 
 def _validated_mapping(mapping: Mapping[str, str] | PEMSConfig | None) -> dict[str, str]:
@@ -55,7 +64,7 @@ def _validated_mapping(mapping: Mapping[str, str] | PEMSConfig | None) -> dict[s
 def _validated_units(units: Mapping[str, str] | None) -> dict[str, str]:
     if not units:
         return {}
-    unknown = set(units.keys()) - ALLOWED
+    unknown = units.keys() - ALLOWED
     if unknown:
         raise ValueError(
             f"Units mapping contains unknown normalized columns: {sorted(unknown)}"
@@ -80,28 +89,26 @@ def _convert_series(
     *,
     unit: str,
     column: str,
-    converter,
+    dst: str,
 ) -> pd.Series:
-    mask = series.notna()
     converted = series.astype(float, copy=True)
-    if not mask.any():
+    if not converted.notna().any():
         return converted
-
-    values = np.fromiter(
-        (converter(float(value), unit) for value in series.loc[mask]),
-        dtype=float,
+    # NaNs pass through the conversion unchanged, so no mask is needed.
+    return pd.Series(
+        convert_array(converted.to_numpy(), unit, dst),
+        index=series.index,
+        name=series.name,
     )
-    converted.loc[mask] = values
-    return converted
 
 
 def _convert_temperature(series: pd.Series, *, unit: str, column: str) -> pd.Series:
-    return _convert_series(series, unit=unit, column=column, converter=normalize_temperature)
+    return _convert_series(series, unit=unit, column=column, dst="degC")
 
 
 def _convert_massflow(series: pd.Series, *, unit: str, column: str) -> pd.Series:
     try:
-        return _convert_series(series, unit=unit, column=column, converter=normalize_massflow)
+        return _convert_series(series, unit=unit, column=column, dst="mg/second")
     except (DimensionalityError, UndefinedUnitError) as exc:  # pragma: no cover
         raise ValueError(
             (
@@ -113,14 +120,14 @@ def _convert_massflow(series: pd.Series, *, unit: str, column: str) -> pd.Series
 
 
 def _convert_exhaust_flow(series: pd.Series, *, unit: str, column: str) -> pd.Series:
-    return _convert_series(series, unit=unit, column=column, converter=normalize_exhaust_flow)
+    return _convert_series(series, unit=unit, column=column, dst="kg/second")
 
 
 def _apply_units(df: pd.DataFrame, units: Mapping[str, str]) -> pd.DataFrame:
     if not units:
         return df
 
-    df = df.copy()
+    df = df.copy(deep=False)
     for column, unit in units.items():
         if column not in df.columns:
             continue
@@ -156,21 +163,28 @@ def _normalize(
         missing_text = ", ".join(sorted(missing_core))
         raise ValueError(f"PEMS data is missing required columns: {missing_text}.")
 
-    df = df.copy()
-    df["timestamp"] = to_utc_series(df["timestamp"])
+    # Columns are only ever replaced wholesale below, so a shallow copy is
+    # enough to keep the caller's frame untouched.
+    df = df.copy(deep=False)
+    timestamps = to_utc_series(df["timestamp"])
+    # The pyarrow engine yields second-resolution datetimes; align them with
+    # the nanosecond keys the GPS/ECU readers produce so streams can be fused.
+    if timestamps.dtype != _TIMESTAMP_DTYPE:
+        timestamps = timestamps.astype(_TIMESTAMP_DTYPE)
+    df["timestamp"] = timestamps
     if df["timestamp"].isna().any():
         raise ValueError("PEMS timestamps could not be parsed into UTC datetimes.")
 
-    for column in df.columns:
-        if column == "timestamp":
-            continue
+    # Only canonical measurement columns survive the final selection, so
+    # extraneous upload columns are never coerced.
+    for column in _NUMERIC_COLUMNS.intersection(df.columns):
         series = df[column]
         if not is_numeric_dtype(series):
             df[column] = pd.to_numeric(series, errors="coerce")
 
     df = _apply_units(df, units_dict)
 
-    df = df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+    df = sort_by_timestamp(df)
 
     ordered = [column for column in ORDERED if column in df.columns]
     if not ordered:
@@ -178,8 +192,76 @@ def _normalize(
     return df[ordered].copy()
 
 
-def read_pems_csv(text: str) -> list[dict[str, str]]:
-    """Parse CSV *text* into a list of dictionaries.
+def _tell(source) -> int | None:
+    """Return the current position of a file-like *source* (``0`` for paths)."""
+
+    if not hasattr(source, "seek"):
+        return 0
+    try:
+        return source.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _rewind(source, position: int) -> None:
+    if hasattr(source, "seek"):
+        source.seek(position)
+
+
+def _numeric_dtype_hint(
+    source,
+    position: int | None,
+    mapping: Mapping[str, str],
+    units: Mapping[str, str],
+    read_csv_kwargs: Mapping[str, object],
+) -> dict[str, str]:
+    """Return a ``float64`` dtype map for header columns that normalize to floats.
+
+    Only columns with a unit conversion are hinted: ``_apply_units`` casts those to
+    ``float`` anyway, so parsing them as floats in the C parser skips a
+    ``to_numeric`` pass without changing the output schema. Other measurement
+    columns (e.g. integer particle counts) keep pandas' inferred dtype.
+    """
+
+    if position is None or not units:
+        return {}
+    if any(key in read_csv_kwargs for key in ("dtype", "chunksize", "iterator")):
+        return {}
+
+    header_kwargs = dict(read_csv_kwargs)
+    header_kwargs["nrows"] = 0
+    try:
+        header = pd.read_csv(source, **header_kwargs).columns
+    except (ValueError, pd.errors.ParserError):
+        return {}
+    finally:
+        _rewind(source, position)
+
+    float_columns = _NUMERIC_COLUMNS.intersection(units)
+    canonical_by_raw = {raw: canonical for canonical, raw in mapping.items()}
+    return {
+        column: "float64"
+        for column in header
+        if canonical_by_raw.get(column, column) in float_columns
+    }
+
+
+def _fast_engine(source, read_csv_kwargs: Mapping[str, object]) -> dict[str, str]:
+    """Select pandas' multi-threaded pyarrow CSV engine when it is safe to do so.
+
+    The pyarrow engine only supports a subset of ``read_csv`` options, so it is
+    used for plain path reads; anything more specific keeps the C parser.
+    """
+
+    if not _PYARROW_AVAILABLE or read_csv_kwargs:
+        return {}
+    if not isinstance(source, (str, os.PathLike)):
+        return {}
+    return {"engine": "pyarrow"}
+
+
+def read_pems_csv(text: str | IO[str]) -> list[dict[str, str]]:
+    """Parse CSV *text* (a string or an open text stream) into a list of dictionaries.
 
     The UI analysis route only needs lightweight access to the raw rows to
     derive aggregates (distance, averages, etc.).  Returning a list of dicts
@@ -187,10 +269,12 @@ def read_pems_csv(text: str) -> list[dict[str, str]]:
     ``DataFrame`` when that additional structure is unnecessary.
     """
 
-    if not text or not text.strip():
-        return []
+    if isinstance(text, str):
+        if not text.strip():
+            return []
+        text = io.StringIO(text)
 
-    reader = csv.DictReader(io.StringIO(text))
+    reader = csv.DictReader(text)
     return [dict(row) for row in reader]
 
 
@@ -205,6 +289,25 @@ class PEMSReader:
         units: Mapping[str, str] | None = None,
         **read_csv_kwargs,
     ) -> pd.DataFrame:
-        frame = pd.read_csv(path, **read_csv_kwargs)
+        position = _tell(path)
+        dtype = _numeric_dtype_hint(
+            path,
+            position,
+            _validated_mapping(columns),
+            _validated_units(units),
+            read_csv_kwargs,
+        )
+        engine = _fast_engine(path, read_csv_kwargs)
+        if dtype or engine:
+            try:
+                frame = pd.read_csv(path, dtype=dtype or None, **engine, **read_csv_kwargs)
+            except ValueError:
+                # A measurement column contains text (or the fast engine rejected
+                # the file); fall back to the C parser with type inference and let
+                # ``_normalize`` coerce the offending values to NaN.
+                _rewind(path, position)
+                frame = pd.read_csv(path, **read_csv_kwargs)
+        else:
+            frame = pd.read_csv(path, **read_csv_kwargs)
         return _normalize(frame, mapping=columns, units=units)
 __all__ = ["PEMSReader", "ORDERED", "read_pems_csv"]
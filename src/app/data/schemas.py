@@ -61,7 +61,7 @@ class PEMSConfig(BaseModel):
     @field_validator("columns")
     @classmethod
     def _only_allowed(cls, v: Mapping[str, str]) -> Mapping[str, str]:
-        unknown = set(v.keys()) - ALLOWED
+        unknown = v.keys() - ALLOWED
         if unknown:
             raise ValueError(
                 f"Unknown normalized keys: {sorted(unknown)}. Allowed: {sorted(ALLOWED)}"
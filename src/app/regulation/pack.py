@@ -19,13 +19,23 @@ _DEFAULT_PACK_PATH = _PROJECT_ROOT / "data" / "regpacks" / "eu7_demo.json"
 
 
 @functools.lru_cache(maxsize=1)
+def _default_regulation_pack() -> RegulationPack:
+    return load_pack(_DEFAULT_PACK_PATH)
+
+
 def load_regulation_pack(
     source: str | pathlib.Path | Mapping[str, Any] | None = None,
 ) -> RegulationPack:
-    """Load the default regulation pack, optionally overriding the source."""
+    """Load the default regulation pack, optionally overriding the source.
+
+    Only the bundled default is cached: it is what every evaluation without an
+    explicit pack uses, and overrides (including unhashable mappings) would
+    otherwise evict it or fail the cache lookup.
+    """
 
-    target = source if source is not None else _DEFAULT_PACK_PATH
-    return load_pack(target)
+    if source is None:
+        return _default_regulation_pack()
+    return load_pack(source)
 
 
 def evaluate_pack(
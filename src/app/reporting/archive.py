@@ -3,19 +3,23 @@ from __future__ import annotations
 """Helpers for producing ZIP archives of analysis results."""
 
 import io
-import json
 import zipfile
-from typing import Any
+from typing import IO, Any
 
 from src.app.reporting.eu7ld_report import apply_guardrails, build_report_data, save_report_json
+from src.app.utils.jsonio import dumps_pretty_bytes
 
 from .html import build_report_html
 
-__all__ = ["build_report_archive"]
+__all__ = ["build_report_archive", "write_report_archive"]
 
 
-def build_report_archive(results: dict[str, Any]) -> bytes:
-    """Create a ZIP archive containing the rendered report and diagnostics."""
+def write_report_archive(results: dict[str, Any], sink: IO[bytes]) -> None:
+    """Write the report archive for *results* into the binary stream *sink*.
+
+    *sink* does not need to be seekable, so callers can stream the archive
+    straight into a response or file without holding a second copy in memory.
+    """
 
     html_document = build_report_html(results)
     diagnostics = (
@@ -30,14 +34,16 @@ def build_report_archive(results: dict[str, Any]) -> bytes:
     except Exception:  # pragma: no cover - diagnostics-only best effort
         report = None
 
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
         archive.writestr("index.html", html_document)
-        archive.writestr("diagnostics.json", json.dumps(diagnostics, indent=2, sort_keys=True))
+        archive.writestr("diagnostics.json", dumps_pretty_bytes(diagnostics))
         if report is not None:
-            archive.writestr(
-                "report.json", json.dumps(report.model_dump(mode="json"), indent=2, sort_keys=True)
-            )
+            archive.writestr("report.json", dumps_pretty_bytes(report.model_dump(mode="json")))
+
 
-    buffer.seek(0)
+def build_report_archive(results: dict[str, Any]) -> bytes:
+    """Create a ZIP archive containing the rendered report and diagnostics."""
+
+    buffer = io.BytesIO()
+    write_report_archive(results, buffer)
     return buffer.getvalue()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 import re
 from collections import defaultdict
@@ -57,6 +56,7 @@ from src.app.regulation.eu7ld_un168_limits import (
     VA_POS95_EXPRESSWAY_MAX,
     VA_POS95_URBAN_MAX,
 )
+from src.app.utils.jsonio import dumps_pretty_bytes, loads as json_loads
 
 from .schemas import (
     Criterion,
@@ -1316,24 +1316,46 @@ def group_criteria_by_section(criteria: Iterable[Criterion]) -> dict[str, list[C
     return dict(grouped)
 
 
+# Parsed reports keyed by path; an entry is reused while the file's
+# (mtime, size) signature is unchanged. Dict order doubles as recency order,
+# and the least recently used path is evicted past ``_REPORT_CACHE_MAXSIZE``.
+_REPORT_CACHE_MAXSIZE = 32
+_REPORT_CACHE: dict[Path, tuple[tuple[int, int], ReportData]] = {}
+
+
 def save_report_json(report: ReportData, *, report_dir: Path | None = None) -> Path:
     directory = report_dir or _ensure_report_dir()
     directory.mkdir(parents=True, exist_ok=True)
     path = directory / f"{report.meta.testId}.json"
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(report.model_dump(mode="json"), handle, indent=2, sort_keys=True)
+    path.write_bytes(dumps_pretty_bytes(report.model_dump(mode="json")))
+    # Drop any parsed copy explicitly: on filesystems with coarse timestamps a
+    # rewrite can keep the same mtime and would otherwise serve stale data.
+    _REPORT_CACHE.pop(path, None)
     return path
 
 
+def _read_report(path: Path) -> ReportData:
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _REPORT_CACHE.pop(path, None)
+    if cached is not None and cached[0] == signature:
+        _REPORT_CACHE[path] = cached
+        return cached[1]
+    # Parse straight from bytes; orjson (when installed) skips the UTF-8 decode.
+    report = ReportData.model_validate(json_loads(path.read_bytes()))
+    _REPORT_CACHE[path] = (signature, report)
+    while len(_REPORT_CACHE) > _REPORT_CACHE_MAXSIZE:
+        del _REPORT_CACHE[next(iter(_REPORT_CACHE))]
+    return report
+
+
 def load_report(test_id: str, *, report_dir: Path | None = None) -> ReportData:
     directory = report_dir or _REPORT_DIR
     path = directory / f"{test_id}.json"
     if not path.exists():
         raise FileNotFoundError(path)
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
-    report = ReportData.model_validate(raw)
-    return apply_guardrails(report)
+    # ``apply_guardrails`` works on a deep copy, so the cached model stays pristine.
+    return apply_guardrails(_read_report(path))
 
 
 __all__ = [
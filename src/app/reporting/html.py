@@ -8,6 +8,18 @@ from typing import Any, Iterable, Mapping
 
 __all__ = ["build_report_html"]
 
+_BADGE_CLASSES: Mapping[str, str] = {
+    "pass": "badge--pass",
+    "warn": "badge--warn",
+    "fail": "badge--fail",
+}
+_TAG_PASS = "tag--pass"
+_TAG_FAIL = "tag--fail"
+_STATUS_TAG_PASS = "<span class=\"tag tag--pass\">PASS</span>"
+_STATUS_TAG_FAIL = "<span class=\"tag tag--fail\">FAIL</span>"
+_MANDATORY_TAG = "<span class=\"tag tag--mandatory\">Mandatory</span>"
+_OPTIONAL_TAG = "<span class=\"tag tag--optional\">Optional</span>"
+
 
 _EXPORT_CSS = """
 :root {
@@ -317,6 +329,20 @@ def _render_counts(regulation: dict[str, Any]) -> str:
     return f"<div class=\"stat-grid\">{''.join(stat_items)}</div>"
 
 
+def _format_repaired_span(span: Mapping[str, Any]) -> str:
+    start = _escape(span.get("start"))
+    end = _escape(span.get("end"))
+    seconds = span.get("seconds")
+    inserted = span.get("inserted")
+    range_text = f"{start} → {end}" if start or end else ""
+    seconds_text = f"{float(seconds):.2f} s" if isinstance(seconds, (int, float)) else ""
+    rows_text = f"{int(inserted)} rows" if isinstance(inserted, (int, float)) else ""
+    if range_text and seconds_text and rows_text:
+        # Common case: every field present, no intermediate list needed.
+        return f"<li>{range_text} · {seconds_text} · {rows_text}</li>"
+    return f"<li>{' · '.join(part for part in (range_text, seconds_text, rows_text) if part)}</li>"
+
+
 def _render_diagnostics(diagnostics: Mapping[str, Any]) -> str:
     data = diagnostics or {}
     summary = data.get("summary") or {}
@@ -344,17 +370,11 @@ def _render_diagnostics(diagnostics: Mapping[str, Any]) -> str:
         else "<p class=\"empty\">No diagnostics summary available.</p>"
     )
 
-    badge_map = {
-        "pass": "badge--pass",
-        "warn": "badge--warn",
-        "fail": "badge--fail",
-    }
-
     if checks:
         entries: list[str] = []
         for entry in checks:
             level = str(entry.get("level") or "warn").lower()
-            badge_class = badge_map.get(level, "badge--warn")
+            badge_class = _BADGE_CLASSES.get(level, "badge--warn")
             subject = entry.get("subject")
             subject_prefix = f"{_escape(subject)} · " if subject else ""
             title = _escape(entry.get("title"))
@@ -377,23 +397,10 @@ def _render_diagnostics(diagnostics: Mapping[str, Any]) -> str:
 
     repairs_html = ""
     if repaired:
-        repairs: list[str] = []
-        for span in repaired:
-            start = _escape(span.get("start"))
-            end = _escape(span.get("end"))
-            seconds = span.get("seconds")
-            inserted = span.get("inserted")
-            parts: list[str] = []
-            if start or end:
-                parts.append(f"{start} → {end}")
-            if isinstance(seconds, (int, float)):
-                parts.append(f"{float(seconds):.2f} s")
-            if isinstance(inserted, (int, float)):
-                parts.append(f"{int(inserted)} rows")
-            repairs.append(f"<li>{' · '.join(parts)}</li>")
+        repairs = "".join([_format_repaired_span(span) for span in repaired])
         repairs_html = (
             "<div class=\"notes\"><strong>Repaired spans:</strong>"
-            f"<ul class=\"list-inline\">{''.join(repairs)}</ul></div>"
+            f"<ul class=\"list-inline\">{repairs}</ul></div>"
         )
 
     return f"{summary_html}<div class=\"summary\">{checks_html}{repairs_html}</div>"
@@ -424,11 +431,10 @@ def _render_bins(bins: Iterable[dict[str, Any]]) -> str:
             ) + "</ul>"
         else:
             kpi_html = "<p class=\"empty\">No KPIs available.</p>"
-        status = "PASS" if entry.get("valid") else "FAIL"
-        status_class = "tag--pass" if entry.get("valid") else "tag--fail"
+        status_tag = _STATUS_TAG_PASS if entry.get("valid") else _STATUS_TAG_FAIL
         rows.append(
             "<tr>"
-            f"<td>{_escape(entry.get('name'))}<span class=\"tag {status_class}\">{status}</span></td>"
+            f"<td>{_escape(entry.get('name'))}{status_tag}</td>"
             f"<td>{_escape(entry.get('time'))}</td>"
             f"<td>{_escape(entry.get('distance'))}</td>"
             f"<td>{kpi_html}</td>"
@@ -499,13 +505,9 @@ def _render_evidence(entries: Iterable[dict[str, Any]]) -> str:
         )
 
         passed = bool(entry.get("passed"))
-        status_tag = f"<span class=\"tag {'tag--pass' if passed else 'tag--fail'}\">{'PASS' if passed else 'FAIL'}</span>"
+        status_tag = _STATUS_TAG_PASS if passed else _STATUS_TAG_FAIL
         mandatory = bool(entry.get("mandatory"))
-        mandatory_tag = (
-            "<span class=\"tag tag--mandatory\">Mandatory</span>"
-            if mandatory
-            else "<span class=\"tag tag--optional\">Optional</span>"
-        )
+        mandatory_tag = _MANDATORY_TAG if mandatory else _OPTIONAL_TAG
 
         rows.append(
             "<tr>"
@@ -537,7 +539,7 @@ def build_report_html(results: dict[str, Any]) -> str:
     generated_at = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     status_ok = bool(regulation.get("ok"))
     status_label = _escape(regulation.get("label") or ("PASS" if status_ok else "FAIL"))
-    status_class = "badge--pass" if status_ok else "badge--fail"
+    status_class = _BADGE_CLASSES["pass"] if status_ok else _BADGE_CLASSES["fail"]
 
     pack_title = _escape(regulation.get("pack_title") or "Regulation pack")
     pack_meta_parts: list[str] = []
@@ -556,7 +558,7 @@ def build_report_html(results: dict[str, Any]) -> str:
     analysis_status = analysis.get("status") or {}
     analysis_status_label = analysis_status.get("label")
     analysis_status_html = (
-        f"<p><strong>Analysis validity:</strong> <span class=\"tag {'tag--pass' if analysis_status.get('ok') else 'tag--fail'}\">{_escape(analysis_status_label)}</span></p>"
+        f"<p><strong>Analysis validity:</strong> <span class=\"tag {_TAG_PASS if analysis_status.get('ok') else _TAG_FAIL}\">{_escape(analysis_status_label)}</span></p>"
         if analysis_status_label
         else ""
     )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import pathlib
 from copy import deepcopy
 from typing import Any, Dict, Mapping
@@ -48,10 +49,19 @@ def _load_yaml(name: str) -> Dict[str, Any]:
             return deepcopy(_FALLBACK_EU7_SPEC)
         raise RuntimeError("PyYAML is required to load legislation specifications.")
 
-    with open(SPEC_DIR / name, "r", encoding="utf-8") as handle:
+    path = SPEC_DIR / name
+    # Callers may mutate the spec, so hand out a copy of the cached parse.
+    return deepcopy(_parse_spec(path, path.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_spec(path: pathlib.Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML spec; keyed on mtime so edits on disk are picked up."""
+
+    with open(path, "r", encoding="utf-8") as handle:
         data = yaml.safe_load(handle) or {}
     if not isinstance(data, dict):  # pragma: no cover - defensive
-        raise ValueError(f"Specification '{name}' must be a mapping.")
+        raise ValueError(f"Specification '{path.name}' must be a mapping.")
     return data
 
 
@@ -104,8 +104,7 @@ class _PhaseData:
 
     @classmethod
     def from_mapping(cls, name: str, payload: Mapping[str, Any], defaults: Mapping[str, Any]) -> "_PhaseData":
-        merged = dict(defaults)
-        merged.update({k: v for k, v in payload.items() if v is not None})
+        merged = {**defaults, **{k: v for k, v in payload.items() if v is not None}}
         return cls(
             name=name,
             distance_km=float(merged.get("distance_km", 0.0)),
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Mapping, Sequence
 
 # Canonical columns (more can be added later)
@@ -42,6 +43,12 @@ class DatasetSchema:
     def all_fields(self) -> tuple[str, ...]:
         return self.required + self.optional
 
+    @cached_property
+    def field_set(self) -> frozenset[str]:
+        """``all_fields`` as a set, built once per schema for membership checks."""
+
+        return frozenset(self.all_fields)
+
     def as_payload(self) -> Mapping[str, object]:
         return {
             "key": self.key,
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List
 
 from fastapi.responses import JSONResponse
 
+from src.app.utils.jsonio import dumps as json_dumps
+from src.app.utils.jsonio import dumps_bytes as json_dumps_bytes
 from src.app.utils.payload import ensure_results_payload_defaults
 
-__all__ = ["make_results_payload", "respond_success"]
+__all__ = ["FastJSONResponse", "make_results_payload", "respond_success"]
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered through :mod:`orjson` when it is installed.
+
+    Unlike ``fastapi.responses.ORJSONResponse`` this keeps working without
+    the optional dependency by falling back to the stdlib encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps_bytes(content)
 
 
 def make_results_payload(
@@ -143,7 +155,7 @@ def make_results_payload(
     else:
         payload_snapshot = dict(payload_snapshot)
 
-    snapshot_json = json.dumps(payload_snapshot, ensure_ascii=False)
+    snapshot_json = json_dumps(payload_snapshot)
     payload_script = f"window.__RDE_RESULT__ = {snapshot_json};"
 
     payload = {
@@ -174,4 +186,4 @@ def respond_success(payload: Dict[str, Any]) -> JSONResponse:
     """Wrap the payload in the canonical API response envelope."""
 
     normalised = ensure_results_payload_defaults(payload)
-    return JSONResponse(status_code=200, content={"results_payload": normalised})
+    return FastJSONResponse(status_code=200, content={"results_payload": normalised})
@@ -245,13 +245,8 @@ def enrich_payload(
     visual = dict(base.get("visual") or {})
     incoming_visual = dict(visual_data or {})
 
-    map_payload = dict(visual.get("map") or {})
-    map_payload.update(incoming_visual.get("map", {}))
-    visual["map"] = map_payload
-
-    chart_payload = dict(visual.get("chart") or {})
-    chart_payload.update(incoming_visual.get("chart", {}))
-    visual["chart"] = chart_payload
+    visual["map"] = {**(visual.get("map") or {}), **incoming_visual.get("map", {})}
+    visual["chart"] = {**(visual.get("chart") or {}), **incoming_visual.get("chart", {})}
 
     if "distance_km" in incoming_visual:
         visual["distance_km"] = incoming_visual.get("distance_km", 0.0)
@@ -2,44 +2,51 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import io
+import os
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Iterable, Mapping, Sequence
+from typing import IO, Any, Callable, Iterable, Mapping, Sequence
 
+import numpy as np
 from fastapi import APIRouter, File, HTTPException, Request, UploadFile
 from fastapi.responses import HTMLResponse
-from starlette.templating import Jinja2Templates
 
 from src.app.data.ingestion.ecu_reader import read_ecu_csv
 from src.app.data.ingestion.gps_reader import read_gps_csv
 from src.app.data.ingestion.pems_reader import read_pems_csv
-from src.app.ui.responses import respond_success
+from src.app.ui.responses import FastJSONResponse, respond_success
 from src.app.ui.routes._eu7_payload import build_normalised_payload, enrich_payload
+from src.app.ui.templating import templates
+from src.app.utils.jsonio import dumps as json_dumps
 
-router = APIRouter()
-templates = Jinja2Templates(directory="src/app/ui/templates")
+router = APIRouter(default_response_class=FastJSONResponse)
 
-async def _as_text(upload: UploadFile | None) -> str | None:
-    """Read *upload* and return decoded text."""
+# Starlette's multipart parser spools each upload to a temporary file; reject
+# oversized parts before they are read back into memory.
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_MB", "200")) * 1024 * 1024
+
+# One worker per upload kind; shared across requests so concurrent analyses
+# queue for CSV parsing instead of oversubscribing the default executor.
+_READER_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="rde-ingest")
+
+
+def _upload_stream(upload: UploadFile | None) -> io.TextIOWrapper | None:
+    """Return a UTF-8 text view over the spooled *upload* without copying it."""
 
     if not upload:
         return None
 
-    data = await upload.read()
-    try:  # reset stream for potential reuse in other middlewares
-        await upload.seek(0)
-    except Exception:  # pragma: no cover - UploadFile.seek may be sync depending on backend
-        try:
-            upload.file.seek(0)  # type: ignore[attr-defined]
-        except Exception:
-            pass
+    if upload.size is not None and upload.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Upload '{upload.filename}' exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit.",
+        )
 
-    if not data:
-        return ""
-    if isinstance(data, bytes):
-        return data.decode("utf-8", errors="ignore")
-    return str(data)
+    upload.file.seek(0)
+    return io.TextIOWrapper(upload.file, encoding="utf-8", errors="ignore", newline="")
 
 
 def _safe_float(value: Any) -> float | None:
@@ -121,24 +128,25 @@ def _gps_latlngs(
     rows: Sequence[dict[str, Any]],
     limit: int = 500,
 ) -> tuple[list[dict[str, float]], dict[str, float], list[list[float]]]:
-    points: list[dict[str, float]] = []
+    pairs: list[tuple[float, float]] = []
     for row in rows:
         lat = _safe_float(row.get("lat"))
         lon = _safe_float(row.get("lon"))
         if lat is None or lon is None:
             continue
-        points.append({"lat": lat, "lon": lon})
-        if len(points) >= limit:
+        pairs.append((lat, lon))
+        if len(pairs) >= limit:
             break
 
-    if not points:
+    if not pairs:
         center = {"lat": 48.2082, "lon": 16.3738}
-        return points, center, []
+        return [], center, []
 
-    lats = [p["lat"] for p in points]
-    lons = [p["lon"] for p in points]
-    center = {"lat": statistics.mean(lats), "lon": statistics.mean(lons)}
-    bounds = [[min(lats), min(lons)], [max(lats), max(lons)]]
+    coords = np.asarray(pairs, dtype=float)
+    mean_lat, mean_lon = coords.mean(axis=0).tolist()
+    center = {"lat": mean_lat, "lon": mean_lon}
+    bounds = [coords.min(axis=0).tolist(), coords.max(axis=0).tolist()]
+    points = [{"lat": lat, "lon": lon} for lat, lon in pairs]
     return points, center, bounds
 
 
@@ -162,6 +170,14 @@ def _gps_loss_seconds(timestamps: Sequence[datetime | None]) -> tuple[int, int]:
     return max(gaps), sum(gaps)
 
 
+def _sample_indices(count: int, max_points: int) -> list[int]:
+    """Return at most *max_points* evenly spaced row indices spanning ``0..count-1``."""
+
+    if count <= max_points:
+        return list(range(count))
+    return np.linspace(0, count - 1, max_points, dtype=np.int64).tolist()
+
+
 def _prepare_inputs(
     pems_rows: Sequence[dict[str, Any]],
     gps_rows: Sequence[dict[str, Any]],
@@ -203,8 +219,7 @@ def _prepare_inputs(
     gps_timestamps = [_parse_timestamp(row.get("timestamp")) for row in gps_rows]
     gps_max_loss, gps_total_loss = _gps_loss_seconds(gps_timestamps or pems_timestamps)
 
-    count = len(pems_rows) or len(gps_rows) or 200
-    capped = min(count, 200)
+    chart_idx = _sample_indices(len(pems_rows), 200)
     visual = {
         "map": {
             "center": gps_center,
@@ -212,17 +227,17 @@ def _prepare_inputs(
             "latlngs": gps_points,
         },
         "chart": {
-            "times": [row.get("timestamp") for row in pems_rows[:capped]],
+            "times": [pems_rows[idx].get("timestamp") for idx in chart_idx],
             "series": [
                 {
                     "name": "Vehicle speed",
                     "unit": "m/s",
-                    "values": [value or 0.0 for value in speed_values[:capped]],
+                    "values": [speed_values[idx] or 0.0 for idx in chart_idx],
                 },
                 {
                     "name": "NOx",
                     "unit": "mg/s",
-                    "values": [value or 0.0 for value in nox_values[:capped]],
+                    "values": [nox_values[idx] or 0.0 for idx in chart_idx],
                 },
             ],
         },
@@ -251,33 +266,34 @@ def _prepare_inputs(
     return engine_inputs, visual
 
 
-def _safe_readers(
-    pems_txt: str | None,
-    gps_txt: str | None,
-    ecu_txt: str | None,
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
-    pems_rows: list[dict[str, Any]] = []
-    gps_rows: list[dict[str, Any]] = []
-    ecu_rows: list[dict[str, Any]] = []
-
-    if pems_txt:
-        try:
-            pems_rows = read_pems_csv(pems_txt)
-        except Exception:
-            pems_rows = []
+def _safe_read(
+    reader: Callable[[IO[str]], list[dict[str, Any]]],
+    stream: io.TextIOWrapper | None,
+) -> list[dict[str, Any]]:
+    if stream is None:
+        return []
+    try:
+        return reader(stream)
+    except Exception:
+        return []
+    finally:
+        # Hand the spooled file back to Starlette, which closes it after the response.
+        stream.detach()
 
-    if gps_txt:
-        try:
-            gps_rows = read_gps_csv(gps_txt)
-        except Exception:
-            gps_rows = []
 
-    if ecu_txt:
-        try:
-            ecu_rows = read_ecu_csv(ecu_txt)
-        except Exception:
-            ecu_rows = []
+async def _safe_readers(
+    pems_stream: io.TextIOWrapper | None,
+    gps_stream: io.TextIOWrapper | None,
+    ecu_stream: io.TextIOWrapper | None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Parse the three uploads concurrently in worker threads."""
 
+    loop = asyncio.get_running_loop()
+    pems_rows, gps_rows, ecu_rows = await asyncio.gather(
+        loop.run_in_executor(_READER_POOL, _safe_read, read_pems_csv, pems_stream),
+        loop.run_in_executor(_READER_POOL, _safe_read, read_gps_csv, gps_stream),
+        loop.run_in_executor(_READER_POOL, _safe_read, read_ecu_csv, ecu_stream),
+    )
     return pems_rows, gps_rows, ecu_rows
 
 
@@ -302,7 +318,7 @@ def _render_response(
     if "application/json" in accept:
         return respond_success(payload)
 
-    payload_json = json.dumps(payload, ensure_ascii=False)
+    payload_json = json_dumps(payload)
     return templates.TemplateResponse(
         "results.html",
         {
@@ -553,81 +569,62 @@ def _build_results_payload(
     return build_normalised_payload(enriched)
 
 
-@router.get("/analyze", include_in_schema=False, response_class=HTMLResponse)
-async def analyze_demo(request: Request, demo: int | None = None):
-    if demo:
-        pems_rows, gps_rows, ecu_rows = _prepare_demo_rows()
-        engine_inputs, visual_data = _prepare_inputs(pems_rows, gps_rows)
-        row_counts = _build_row_counts(pems_rows, gps_rows, ecu_rows)
-        emissions = _build_emissions_payload(engine_inputs)
-        metrics = _build_metrics(engine_inputs, visual_data, row_counts)
-        kpi_numbers = _build_kpi_numbers(metrics, emissions, visual_data)
-
-        meta_overrides = {
-            "test_id": "demo-run",
-            "engine": "WLTP-ICE 2.0L",
-            "propulsion": "ICE",
-            "velocity_source": "GPS",
-            "nox_mg_per_km": emissions["trip"]["NOx_mg_km"],
-            "pn_per_km": emissions["trip"]["PN_hash_km"],
-            "co_mg_per_km": emissions["trip"]["CO_mg_km"],
-        }
+def _analyze_uploads(
+    pems_rows: list[dict[str, Any]],
+    gps_rows: list[dict[str, Any]],
+    ecu_rows: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Run the synchronous, CPU-bound analysis over parsed upload rows."""
 
-        payload = _build_results_payload(
-            metrics=metrics,
-            emissions=emissions,
-            visual_data=visual_data,
-            row_counts=row_counts,
-            meta_overrides=meta_overrides,
-            kpi_numbers=kpi_numbers,
-        )
-        payload_json = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
-        return templates.TemplateResponse(
-            "results.html",
-            {
-                "request": request,
-                "results_payload": payload,
-                "results_payload_json": payload_json,
-            },
-        )
+    engine_inputs, visual_data = _prepare_inputs(pems_rows, gps_rows)
+    row_counts = _build_row_counts(pems_rows, gps_rows, ecu_rows)
 
-    raise HTTPException(status_code=400, detail="Demo flag required for GET /analyze.")
+    emissions = _build_emissions_payload(engine_inputs)
+    metrics = _build_metrics(engine_inputs, visual_data, row_counts)
+    kpi_numbers = _build_kpi_numbers(metrics, emissions, visual_data)
 
+    velocity_source = "GPS" if row_counts.get("gps_rows") else "ECU"
+    meta_overrides = {
+        "test_id": "analysis-run",
+        "engine": "WLTP-ICE 2.0L",
+        "propulsion": "ICE",
+        "velocity_source": velocity_source,
+        "nox_mg_per_km": emissions["trip"]["NOx_mg_km"],
+        "pn_per_km": emissions["trip"]["PN_hash_km"],
+        "co_mg_per_km": emissions["trip"]["CO_mg_km"],
+    }
 
-@router.post("/analyze", include_in_schema=False)
-async def analyze(
-    request: Request,
-    pems_file: UploadFile | None = File(default=None),
-    gps_file: UploadFile | None = File(default=None),
-    ecu_file: UploadFile | None = File(default=None),
-):
-    """Process uploaded demo CSV files and return an EU7 results payload."""
+    return _build_results_payload(
+        metrics=metrics,
+        emissions=emissions,
+        visual_data=visual_data,
+        row_counts=row_counts,
+        meta_overrides=meta_overrides,
+        kpi_numbers=kpi_numbers,
+    )
 
-    pems_txt = await _as_text(pems_file)
-    gps_txt = await _as_text(gps_file)
-    ecu_txt = await _as_text(ecu_file)
 
-    pems_rows, gps_rows, ecu_rows = _safe_readers(pems_txt, gps_txt, ecu_txt)
+def _analyze_demo() -> dict[str, Any]:
+    """Build the results payload for the bundled demo trip."""
 
+    pems_rows, gps_rows, ecu_rows = _prepare_demo_rows()
     engine_inputs, visual_data = _prepare_inputs(pems_rows, gps_rows)
     row_counts = _build_row_counts(pems_rows, gps_rows, ecu_rows)
-
     emissions = _build_emissions_payload(engine_inputs)
     metrics = _build_metrics(engine_inputs, visual_data, row_counts)
     kpi_numbers = _build_kpi_numbers(metrics, emissions, visual_data)
 
-    velocity_source = "GPS" if row_counts.get("gps_rows") else "ECU"
     meta_overrides = {
-        "test_id": "analysis-run",
+        "test_id": "demo-run",
         "engine": "WLTP-ICE 2.0L",
         "propulsion": "ICE",
-        "velocity_source": velocity_source,
+        "velocity_source": "GPS",
         "nox_mg_per_km": emissions["trip"]["NOx_mg_km"],
         "pn_per_km": emissions["trip"]["PN_hash_km"],
         "co_mg_per_km": emissions["trip"]["CO_mg_km"],
     }
 
-    results_payload = _build_results_payload(
+    return _build_results_payload(
         metrics=metrics,
         emissions=emissions,
         visual_data=visual_data,
@@ -636,6 +633,41 @@ async def analyze(
         kpi_numbers=kpi_numbers,
     )
 
+
+@router.get("/analyze", include_in_schema=False, response_class=HTMLResponse)
+async def analyze_demo(request: Request, demo: int | None = None):
+    if demo:
+        payload = await asyncio.to_thread(_analyze_demo)
+        payload_json = json_dumps(payload)
+        return templates.TemplateResponse(
+            "results.html",
+            {
+                "request": request,
+                "results_payload": payload,
+                "results_payload_json": payload_json,
+            },
+        )
+
+    raise HTTPException(status_code=400, detail="Demo flag required for GET /analyze.")
+
+
+@router.post("/analyze", include_in_schema=False)
+async def analyze(
+    request: Request,
+    pems_file: UploadFile | None = File(default=None),
+    gps_file: UploadFile | None = File(default=None),
+    ecu_file: UploadFile | None = File(default=None),
+):
+    """Process uploaded demo CSV files and return an EU7 results payload."""
+
+    pems_rows, gps_rows, ecu_rows = await _safe_readers(
+        _upload_stream(pems_file),
+        _upload_stream(gps_file),
+        _upload_stream(ecu_file),
+    )
+    # Keep the event loop free for other requests while the analysis runs.
+    results_payload = await asyncio.to_thread(_analyze_uploads, pems_rows, gps_rows, ecu_rows)
+
     return _render_response(request, results_payload)
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import io
+from collections.abc import Iterator
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipFile
 
@@ -16,31 +17,88 @@ REPO_ROOT = Path(__file__).resolve().parents[4]
 SAMPLES_DIR = REPO_ROOT / "data" / "samples"
 ALLOWED_SAMPLE_FILES = ("ecu_demo.csv", "gps_demo.csv", "pems_demo.csv")
 
+# zlib level 1 is several times faster than the default 6 at most of the ratio
+# on CSV text.
+SAMPLE_ZIP_COMPRESSLEVEL = 1
+
+
+class _ZipChunkSink:
+    """Write-only, non-seekable file object that hands out what was written."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _write_samples(archive: ZipFile) -> Iterator[str]:
+    """Add each available sample to *archive*, yielding its name once written."""
+
+    for filename in ALLOWED_SAMPLE_FILES:
+        file_path = SAMPLES_DIR / filename
+        if not file_path.exists():
+            continue
+        archive.write(
+            file_path,
+            arcname=filename,
+            compress_type=ZIP_DEFLATED,
+            compresslevel=SAMPLE_ZIP_COMPRESSLEVEL,
+        )
+        yield filename
+
 
 def build_samples_zip_bytes() -> bytes:
     """Create an in-memory ZIP archive with the whitelisted sample CSVs."""
 
     buffer = io.BytesIO()
     with ZipFile(buffer, "w", ZIP_DEFLATED) as archive:
-        for filename in ALLOWED_SAMPLE_FILES:
-            file_path = SAMPLES_DIR / filename
-            if file_path.exists():
-                archive.write(file_path, arcname=filename)
+        for _ in _write_samples(archive):
+            pass
     return buffer.getvalue()
 
 
+def iter_samples_zip() -> Iterator[bytes]:
+    """Yield the sample ZIP archive member by member as it is compressed.
+
+    The archive is written to a non-seekable sink, so :mod:`zipfile` emits data
+    descriptors and never needs the whole archive in memory.
+    """
+
+    sink = _ZipChunkSink()
+    with ZipFile(sink, "w", ZIP_DEFLATED) as archive:
+        for _ in _write_samples(archive):
+            data = sink.drain()
+            if data:
+                yield data
+    tail = sink.drain()
+    if tail:
+        yield tail
+
+
 @router.get("/export_zip", include_in_schema=False)
 def export_zip(download: int = 1):
     """Return the RDE sample ZIP either as a file download or JSON envelope."""
 
-    blob = build_samples_zip_bytes()
     if download:
+        # Plain iterator: Starlette drains it in a worker thread, so deflate
+        # never runs on the event loop.
         return StreamingResponse(
-            io.BytesIO(blob),
+            iter_samples_zip(),
             media_type="application/zip",
             headers={"Content-Disposition": 'attachment; filename="rde_export.zip"'},
         )
 
+    blob = build_samples_zip_bytes()
     return {
         "results_payload": {
             "diagnostics": ["Download ZIP ready"],
@@ -55,4 +113,4 @@ def export_zip(download: int = 1):
     }
 
 
-__all__ = ["router", "build_samples_zip_bytes"]
+__all__ = ["router", "build_samples_zip_bytes", "iter_samples_zip"]
@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
-from starlette.templating import Jinja2Templates
 
 from src.app.reporting.eu7ld_report import (
     apply_guardrails,
     build_report_data,
     save_report_json,
 )
+from src.app.ui.templating import templates
+from src.app.utils.jsonio import loads as json_loads
 
 router = APIRouter()
-templates = Jinja2Templates(directory="src/app/ui/templates")
 
 _DEV_PDF_BYTES = (
     b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
@@ -29,6 +30,18 @@ _DEV_PDF_BYTES = (
 )
 
 
+def _save_report(payload: dict) -> None:
+    report = apply_guardrails(build_report_data(payload))
+    save_report_json(report)
+
+
+def _render_pdf(payload: dict) -> bytes:
+    from weasyprint import HTML
+
+    html = templates.get_template("print_eu7.html").render({"results_payload": payload})
+    return HTML(string=html).write_pdf()
+
+
 @router.post("/export_pdf", include_in_schema=False)
 async def export_pdf(request: Request) -> Response:
     content_type = (request.headers.get("content-type") or "").lower()
@@ -37,7 +50,12 @@ async def export_pdf(request: Request) -> Response:
 
     data: dict | None = None
     if "application/json" in content_type:
-        data = await request.json()
+        try:
+            data = json_loads(await request.body())
+        except json.JSONDecodeError as exc:
+            raise HTTPException(status_code=400, detail="Request body must be valid JSON.") from exc
+        if not isinstance(data, dict):
+            raise HTTPException(status_code=400, detail="Request body must be a JSON object.")
     elif "application/x-www-form-urlencoded" in content_type or "multipart/form-data" in content_type:
         form = await request.form()
         data = dict(form)
@@ -47,7 +65,7 @@ async def export_pdf(request: Request) -> Response:
     payload = (data or {}).get("results_payload")
     if isinstance(payload, str):
         try:
-            payload = json.loads(payload)
+            payload = json_loads(payload)
         except json.JSONDecodeError as exc:
             raise HTTPException(status_code=400, detail="Results payload must be valid JSON.") from exc
 
@@ -57,8 +75,8 @@ async def export_pdf(request: Request) -> Response:
     if not isinstance(payload, dict):
         raise HTTPException(status_code=400, detail="Results payload must be a JSON object.")
 
-    report = apply_guardrails(build_report_data(payload))
-    save_report_json(report)
+    # Report building and PDF layout are CPU-bound; keep them off the event loop.
+    await asyncio.to_thread(_save_report, payload)
 
     try:
         from weasyprint import HTML  # noqa: F401
@@ -71,10 +89,7 @@ async def export_pdf(request: Request) -> Response:
             )
         raise HTTPException(status_code=503, detail="WeasyPrint not installed")
 
-    html = templates.get_template("print_eu7.html").render({"results_payload": payload})
-    from weasyprint import HTML
-
-    pdf = HTML(string=html).write_pdf()
+    pdf = await asyncio.to_thread(_render_pdf, payload)
     return Response(
         content=pdf,
         media_type="application/pdf",
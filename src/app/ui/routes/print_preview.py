@@ -3,12 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 
 from fastapi import APIRouter, Request
-from starlette.templating import Jinja2Templates
 
 from src.app.rules.engine import evaluate_eu7_ld
+from src.app.ui.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="src/app/ui/templates")
 
 
 @router.get("/print_preview", include_in_schema=False)
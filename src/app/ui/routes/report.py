@@ -4,18 +4,16 @@ from __future__ import annotations
 
 from typing import Any, Iterable
 
-import json
-
 from fastapi import APIRouter, HTTPException, Request
-from starlette.templating import Jinja2Templates
 
 from src.app.reporting.eu7ld_report import group_criteria_by_section, load_report
 from src.app.reporting.schemas import Criterion, PassFail, ReportData
 from src.app.ui.routes._eu7_payload import build_normalised_payload
+from src.app.ui.templating import templates
+from src.app.utils.jsonio import dumps as json_dumps
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="src/app/ui/templates")
 
 
 def _criterion_lookup(criteria: Iterable[Criterion]) -> dict[str, Criterion]:
@@ -114,7 +112,7 @@ def report_view(request: Request, test_id: str):
     quick_cards = _build_quick_cards(report)
     overall = _overall_result(report.criteria)
     payload = build_normalised_payload(report.model_dump(mode="json"))
-    payload_json = json.dumps(payload, ensure_ascii=False)
+    payload_json = json_dumps(payload)
     final_block = payload.get("final", {}) if isinstance(payload.get("final"), dict) else {}
     overall_pass = final_block.get("pass") if isinstance(final_block.get("pass"), bool) else None
     return templates.TemplateResponse(
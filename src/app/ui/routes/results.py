@@ -2,17 +2,15 @@
 
 from __future__ import annotations
 
-import json
-
 from fastapi import APIRouter, Request
-from starlette.templating import Jinja2Templates
 
 from src.app.rules.engine import evaluate_eu7_ld
-from src.app.ui.responses import respond_success
+from src.app.ui.responses import FastJSONResponse, respond_success
 from src.app.ui.routes._eu7_payload import build_normalised_payload, enrich_payload
+from src.app.ui.templating import templates
+from src.app.utils.jsonio import dumps as json_dumps
 
-router = APIRouter()
-templates = Jinja2Templates(directory="src/app/ui/templates")
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 def _build_inputs_from_session_or_demo(request: Request) -> dict:
@@ -46,7 +44,7 @@ def results(request: Request):
     if "application/json" in accept:
         return respond_success(normalised)
 
-    payload_json = json.dumps(normalised, ensure_ascii=False)
+    payload_json = json_dumps(normalised)
     return templates.TemplateResponse(
         "results.html",
         {
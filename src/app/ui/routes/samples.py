@@ -2,25 +2,52 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 
 router = APIRouter()
 ROOT = Path(__file__).resolve().parents[4]
-SAMPLES = {
-    "pems_demo.csv": ROOT / "data" / "samples" / "pems_demo.csv",
-    "gps_demo.csv": ROOT / "data" / "samples" / "gps_demo.csv",
-    "ecu_demo.csv": ROOT / "data" / "samples" / "ecu_demo.csv",
-}
+SAMPLES_DIR = ROOT / "data" / "samples"
+SAMPLE_NAMES = ("pems_demo.csv", "gps_demo.csv", "ecu_demo.csv")
+
+
+def _scan_samples() -> dict[str, Path]:
+    """Index the bundled samples with one directory scan instead of a stat per request."""
+
+    try:
+        with os.scandir(SAMPLES_DIR) as entries:
+            return {
+                entry.name: Path(entry.path)
+                for entry in entries
+                if entry.name in SAMPLE_NAMES and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
+
+SAMPLES = _scan_samples()
+
+# When served behind nginx, set this to an ``internal`` location aliased to
+# ``data/samples`` (e.g. ``/_samples/``) so nginx sends the file itself.
+XACCEL_PREFIX = os.environ.get("SAMPLES_XACCEL_PREFIX", "")
 
 
 @router.get("/samples/{name}", include_in_schema=False)
-def get_sample(name: str) -> FileResponse:
+def get_sample(name: str) -> Response:
     path = SAMPLES.get(name)
-    if not path or not path.exists():
+    if path is None:
         raise HTTPException(status_code=404, detail="Not found")
+    if XACCEL_PREFIX:
+        return Response(
+            media_type="text/csv",
+            headers={
+                "X-Accel-Redirect": f"{XACCEL_PREFIX.rstrip('/')}/{name}",
+                "Content-Disposition": f'attachment; filename="{name}"',
+            },
+        )
     return FileResponse(path, media_type="text/csv", filename=name)
 
 
@@ -2,35 +2,93 @@
 
 from __future__ import annotations
 
-import io
+import functools
+import hashlib
 
 from fastapi import APIRouter, Request
-from starlette.responses import StreamingResponse
-from starlette.templating import Jinja2Templates
+from starlette.responses import HTMLResponse, Response
 
+from src.app.schemas.canonical import UNIT_HINTS, as_payload
 from src.app.ui.routes.export import build_samples_zip_bytes
+from src.app.ui.templating import templates
+from src.app.utils.jsonio import dumps as json_dumps
 
 router = APIRouter()
-templates = Jinja2Templates(directory="src/app/ui/templates")
+
+_INDEX_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+
+@functools.cache
+def _canonical_schema_json() -> str:
+    return json_dumps({"datasets": as_payload()})
+
+
+@functools.cache
+def _unit_hints_json() -> str:
+    return json_dumps(dict(UNIT_HINTS))
+
+
+@functools.lru_cache(maxsize=1)
+def _render_index_page() -> str:
+    """Render ``index.html`` once; the landing page has no per-request state."""
+
+    return templates.get_template("index.html").render(
+        {
+            "canonical_schema_json": _canonical_schema_json(),
+            "unit_hints_json": _unit_hints_json(),
+        }
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _index_etag() -> str:
+    digest = hashlib.blake2b(_render_index_page().encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.get("/", include_in_schema=False)
-async def index(request: Request):
+async def index(request: Request) -> Response:
     """Render the landing page that hosts the upload workflow."""
 
-    return templates.TemplateResponse("index.html", {"request": request})
+    etag = _index_etag()
+    headers = {"ETag": etag, "Cache-Control": _INDEX_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(_render_index_page(), headers=headers)
+
+
+@functools.lru_cache(maxsize=1)
+def _samples_zip_archive() -> tuple[bytes, str]:
+    """Build the static samples archive once and return it with its ETag."""
+
+    blob = build_samples_zip_bytes()
+    return blob, f'"{hashlib.sha256(blob).hexdigest()}"'
 
 
 @router.get("/samples.zip", include_in_schema=False)
-def samples_zip() -> StreamingResponse:
+def samples_zip(request: Request) -> Response:
     """Return all demo CSVs bundled into a zip archive."""
 
-    blob = build_samples_zip_bytes()
-    return StreamingResponse(
-        io.BytesIO(blob),
-        media_type="application/zip",
-        headers={"Content-Disposition": 'attachment; filename="samples.zip"'},
-    )
+    blob, etag = _samples_zip_archive()
+    headers = {"ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    headers["Content-Disposition"] = 'attachment; filename="samples.zip"'
+    return Response(content=blob, media_type="application/zip", headers=headers)
+
+
+def warm_page_caches() -> None:
+    """Render the landing page and build the samples archive ahead of the first request."""
+
+    _render_index_page()
+    _samples_zip_archive()
 
 
-__all__ = ["router"]
+__all__ = ["router", "warm_page_caches"]
@@ -0,0 +1,56 @@
+"""Static file serving that prefers precompressed ``.gz`` siblings."""
+
+from __future__ import annotations
+
+import mimetypes
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+
+def _accepts_gzip(scope: Scope) -> bool:
+    header = Headers(scope=scope).get("accept-encoding", "")
+    for token in header.split(","):
+        coding, _, params = token.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        _, _, quality = params.strip().partition("q=")
+        try:
+            return float(quality) > 0 if quality else True
+        except ValueError:
+            return True
+    return False
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Serve ``<path>.gz`` with ``Content-Encoding: gzip`` when the client accepts it.
+
+    Assets are compressed once at deploy time (``gzip -k -9``) rather than on
+    every response; files without a ``.gz`` sibling are served as-is.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if path.endswith(".gz"):
+            return await super().get_response(path, scope)
+        if _accepts_gzip(scope):
+            try:
+                response = await super().get_response(path + ".gz", scope)
+            except HTTPException:
+                response = None
+            if response is not None:
+                media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                response.headers["Content-Type"] = media_type
+                response.headers["Content-Encoding"] = "gzip"
+                response.headers["Vary"] = "Accept-Encoding"
+                return response
+        # The identity response varies on Accept-Encoding too; without it a
+        # shared cache could hand the uncompressed body to every client.
+        response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+
+__all__ = ["PrecompressedStaticFiles"]
@@ -0,0 +1,41 @@
+"""Shared Jinja2 template environment for the UI routes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from jinja2 import FileSystemBytecodeCache
+from starlette.templating import Jinja2Templates
+
+TEMPLATE_DIR = Path("src/app/ui/templates")
+
+# Set RDE_DEV_RELOAD=1 while editing templates to pick up changes without a restart.
+DEV_RELOAD = os.environ.get("RDE_DEV_RELOAD", "").lower() in ("1", "true", "yes")
+
+# Point JINJA_BYTECODE_CACHE_DIR at a shared directory so additional workers
+# load compiled templates from disk instead of compiling them again.
+BYTECODE_CACHE_DIR = os.environ.get("JINJA_BYTECODE_CACHE_DIR", "")
+
+templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+
+if BYTECODE_CACHE_DIR:
+    Path(BYTECODE_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(BYTECODE_CACHE_DIR)
+
+
+def _warm_template_cache() -> None:
+    """Compile every template once so requests never stat or parse templates."""
+
+    env = templates.env
+    env.auto_reload = False
+    env.cache = {}  # unbounded: the template set is small and fixed
+    for path in sorted(TEMPLATE_DIR.rglob("*.html")):
+        env.get_template(path.relative_to(TEMPLATE_DIR).as_posix())
+
+
+if not DEV_RELOAD:
+    _warm_template_cache()
+
+
+__all__ = ["BYTECODE_CACHE_DIR", "DEV_RELOAD", "TEMPLATE_DIR", "templates"]
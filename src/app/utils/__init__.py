@@ -1,7 +1,8 @@
 """Utility helpers for the application."""
 
-from .time import to_utc_series
+from .time import sort_by_timestamp, to_utc_series
 from .units import (
+    convert_array,
     convert_value,
     normalize_exhaust_flow,
     normalize_massflow,
@@ -11,10 +12,12 @@ from .units import (
 )
 
 __all__ = [
+    "sort_by_timestamp",
     "to_utc_series",
     "ureg",
     "to_quantity",
     "convert_value",
+    "convert_array",
     "normalize_temperature",
     "normalize_massflow",
     "normalize_exhaust_flow",
@@ -0,0 +1,105 @@
+"""JSON encoding helpers with an optional :mod:`orjson` fast path."""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:  # pragma: no cover - exercised implicitly depending on the environment
+    import orjson
+except Exception:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _finite(value: Any) -> Any:
+    """Replace non-finite floats with ``None``, matching orjson's ``null`` output."""
+
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _default(value: Any) -> Any:
+    """Coerce NumPy scalars and other array-likes the encoders do not know about."""
+
+    if hasattr(value, "tolist"):
+        return _finite(value.tolist())
+    if hasattr(value, "item"):
+        return _finite(value.item())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(payload: Any) -> bytes:
+    """Serialize ``payload`` to compact UTF-8 encoded JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        _finite(payload),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+        default=_default,
+    ).encode("utf-8")
+
+
+def dumps(payload: Any) -> str:
+    """Serialize ``payload`` to a compact JSON string (e.g. for inline ``<script>`` tags)."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(
+        _finite(payload),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+        default=_default,
+    )
+
+
+def dumps_pretty_bytes(payload: Any) -> bytes:
+    """Serialize ``payload`` to indented, key-sorted UTF-8 JSON for files meant to be read."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=_default,
+            option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+        )
+    return json.dumps(
+        _finite(payload),
+        ensure_ascii=False,
+        indent=2,
+        sort_keys=True,
+        allow_nan=False,
+        default=_default,
+    ).encode("utf-8")
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Parse JSON from ``str`` or UTF-8 ``bytes``.
+
+    orjson rejects the bare ``NaN``/``Infinity`` tokens that :func:`json.dumps`
+    writes by default, so such documents fall back to the stdlib parser.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+__all__ = ["dumps", "dumps_bytes", "dumps_pretty_bytes", "loads"]
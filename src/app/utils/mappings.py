@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import json
-import re
 from dataclasses import dataclass
 from typing import Any, Mapping
 
-from src.app.schemas import CANONICAL, DatasetSchema, get_schema
+from src.app.schemas import CANONICAL, get_schema
+from src.app.utils.jsonio import loads as json_loads
 
 
 class MappingValidationError(ValueError):
@@ -49,10 +49,15 @@ def _label_for(dataset: str) -> str:
     return schema.label if schema else dataset.upper()
 
 
-def _clean_pairs(payload: Mapping[str, Any] | None) -> dict[str, str]:
+def _clean_pairs(
+    payload: Mapping[str, Any] | None, allowed: frozenset[str]
+) -> tuple[dict[str, str], list[str]]:
+    """Strip and keep the non-empty pairs, collecting names outside *allowed* in one pass."""
+
     cleaned: dict[str, str] = {}
+    unknown: list[str] = []
     if not payload:
-        return cleaned
+        return cleaned, unknown
     for key, value in payload.items():
         if not isinstance(key, str):
             raise ValueError("Canonical column names must be strings.")
@@ -66,43 +71,35 @@ def _clean_pairs(payload: Mapping[str, Any] | None) -> dict[str, str]:
         raw = value.strip()
         if raw:
             cleaned[canonical] = raw
-    return cleaned
+            if canonical not in allowed:
+                unknown.append(canonical)
+    return cleaned, unknown
 
 
-def _validate_columns(dataset: DatasetSchema, columns: Mapping[str, str]) -> None:
-    allowed = set(dataset.all_fields)
-    unknown = [name for name in columns if name not in allowed]
-    if unknown:
+def validate_dataset_mapping(dataset: str, payload: Mapping[str, Any] | None) -> DatasetMapping:
+    schema = get_schema(dataset)
+    if not payload:
+        # Nothing to clean or validate; most uploads leave some datasets unmapped.
+        return DatasetMapping(dataset=dataset, columns={}, units={})
+    if not isinstance(payload, Mapping):
         raise MappingValidationError(
-            f"Unknown canonical columns for {_label_for(dataset.key)}: {', '.join(sorted(unknown))}.",
-            dataset=dataset.key,
+            f"{_label_for(dataset)} mapping must be a JSON object.", dataset=dataset
         )
 
-
-def _validate_units(dataset: DatasetSchema, units: Mapping[str, str]) -> None:
-    allowed = set(dataset.all_fields)
-    unknown = [name for name in units if name not in allowed]
+    label = _label_for(schema.key)
+    columns, unknown = _clean_pairs(payload.get("columns"), schema.field_set)
     if unknown:
         raise MappingValidationError(
-            f"Units supplied for unknown {_label_for(dataset.key)} columns: {', '.join(sorted(unknown))}.",
-            dataset=dataset.key,
+            f"Unknown canonical columns for {label}: {', '.join(sorted(unknown))}.",
+            dataset=schema.key,
         )
-
-
-def validate_dataset_mapping(dataset: str, payload: Mapping[str, Any] | None) -> DatasetMapping:
-    schema = get_schema(dataset)
-    payload = payload or {}
-    if not isinstance(payload, Mapping):
+    units, unknown = _clean_pairs(payload.get("units"), schema.field_set)
+    if unknown:
         raise MappingValidationError(
-            f"{_label_for(dataset)} mapping must be a JSON object.", dataset=dataset
+            f"Units supplied for unknown {label} columns: {', '.join(sorted(unknown))}.",
+            dataset=schema.key,
         )
 
-    columns = _clean_pairs(payload.get("columns") if isinstance(payload, Mapping) else None)
-    units = _clean_pairs(payload.get("units") if isinstance(payload, Mapping) else None)
-
-    _validate_columns(schema, columns)
-    _validate_units(schema, units)
-
     return DatasetMapping(dataset=dataset, columns=columns, units=units)
 
 
@@ -129,7 +126,7 @@ def parse_mapping_payload(raw: str | bytes | None) -> DatasetMappingState:
     if not raw:
         return {}
     try:
-        payload = json.loads(raw)
+        payload = json_loads(raw)
     except json.JSONDecodeError as exc:
         raise MappingValidationError("Column mapping payload is not valid JSON.") from exc
     if not isinstance(payload, Mapping):
@@ -145,13 +142,15 @@ def serialise_mapping_state(state: DatasetMappingState) -> dict[str, Any]:
     return {key: mapping.to_payload() for key, mapping in state.items()}
 
 
-_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+_SLUG_KEEP = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789- ")
+# Spaces become dashes; every other byte outside ``[a-z0-9-]`` is dropped.
+_SLUG_TABLE = bytes.maketrans(b" ", b"-")
+_SLUG_DELETE = bytes(byte for byte in range(256) if byte not in _SLUG_KEEP)
 
 
 def slugify_profile_name(name: str) -> str:
-    slug = name.strip().lower().replace(" ", "-")
-    slug = _SLUG_RE.sub("", slug)
-    return slug[:64]
+    ascii_name = name.strip().lower().encode("ascii", "ignore")
+    return ascii_name.translate(_SLUG_TABLE, _SLUG_DELETE).decode("ascii")[:64]
 
 
 __all__ = [
@@ -2,11 +2,53 @@
 
 from __future__ import annotations
 
+from typing import Any, Callable
+
 __all__ = ["ensure_results_payload_defaults"]
 
+_MAP_KEYS = ("center", "latlngs")
+_CHART_KEYS = ("series", "labels")
+_DEFAULT_KPI_NUMBERS = (
+    {"key": "trips", "label": "Trips", "value": 0, "unit": ""},
+    {"key": "distance_km", "label": "Distance [km]", "value": 0, "unit": "km"},
+    {
+        "key": "avg_speed_kmh",
+        "label": "Avg Speed [km/h]",
+        "value": 0,
+        "unit": "km/h",
+    },
+)
+
+
+def _default_map() -> dict[str, Any]:
+    return {
+        "center": {"lat": 48.2082, "lon": 16.3738, "zoom": 8},
+        "latlngs": [],
+    }
+
+
+def _default_chart() -> dict[str, Any]:
+    return {"series": [], "labels": []}
+
+
+def _with_defaults(
+    section: Any, keys: tuple[str, ...], factory: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """Return *section* as-is when it has every key in *keys*, else merge it over fresh defaults."""
+
+    if isinstance(section, dict) and all(key in section for key in keys):
+        return section
+    merged = factory()
+    if isinstance(section, dict):
+        merged.update(section)
+    return merged
+
 
 def ensure_results_payload_defaults(payload: dict | None) -> dict:
-    """Return a defensive copy of *payload* with visual/KPI defaults applied."""
+    """Return a shallow copy of *payload* with visual/KPI defaults applied.
+
+    Nested sections that are already complete are reused rather than copied.
+    """
 
     raw = payload
     if hasattr(raw, "model_dump") and callable(raw.model_dump):  # type: ignore[attr-defined]
@@ -16,39 +58,21 @@ def ensure_results_payload_defaults(payload: dict | None) -> dict:
 
     p = dict(raw or {})
 
-    visual = dict(p.get("visual") or {})
-
-    default_map = {
-        "center": {"lat": 48.2082, "lon": 16.3738, "zoom": 8},
-        "latlngs": [],
-    }
-    map_payload = visual.get("map")
-    if not isinstance(map_payload, dict):
-        map_payload = {}
-    merged_map = {**default_map, **map_payload}
-    visual["map"] = merged_map
-
-    chart_payload = visual.get("chart")
-    if not isinstance(chart_payload, dict):
-        chart_payload = {}
-    visual["chart"] = {**{"series": [], "labels": []}, **chart_payload}
-
-    p["visual"] = visual
+    visual = p.get("visual") or {}
+    map_payload = _with_defaults(visual.get("map"), _MAP_KEYS, _default_map)
+    chart_payload = _with_defaults(visual.get("chart"), _CHART_KEYS, _default_chart)
+    if (
+        not isinstance(visual, dict)
+        or visual.get("map") is not map_payload
+        or visual.get("chart") is not chart_payload
+    ):
+        p["visual"] = {**visual, "map": map_payload, "chart": chart_payload}
 
     # Mirror legacy 'kpis' into 'kpi_numbers' if needed
     if p.get("kpi_numbers") is None and p.get("kpis") is not None:
         p["kpi_numbers"] = p["kpis"]
 
     if p.get("kpi_numbers") is None:
-        p["kpi_numbers"] = [
-            {"key": "trips", "label": "Trips", "value": 0, "unit": ""},
-            {"key": "distance_km", "label": "Distance [km]", "value": 0, "unit": "km"},
-            {
-                "key": "avg_speed_kmh",
-                "label": "Avg Speed [km/h]",
-                "value": 0,
-                "unit": "km/h",
-            },
-        ]
+        p["kpi_numbers"] = [dict(item) for item in _DEFAULT_KPI_NUMBERS]
 
     return p
@@ -1,10 +1,34 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable
 
 import numpy as np
 import pandas as pd
 
+# A clock time followed by ``Z`` or a numeric UTC offset.
+_OFFSET_SUFFIX = re.compile(r"\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?\s*(?:[zZ]|[+-]\d{2}(?::?\d{2})?)\s*$")
+
+
+def _parse_iso8601(ts: pd.Series) -> pd.Series:
+    """Parse ``ts`` in bulk with pandas' ISO 8601 parser; failures become ``NaT``.
+
+    Values with and without a UTC offset are parsed separately: in a single
+    call pandas applies the last seen offset to the naive values that follow.
+    """
+
+    out = pd.Series(pd.NaT, index=ts.index, dtype="datetime64[ns, UTC]")
+    if ts.empty:
+        return out
+    try:
+        has_offset = ts.str.contains(_OFFSET_SUFFIX, na=False).to_numpy(dtype=bool)
+    except AttributeError:  # no strings at all (numbers, datetime objects)
+        has_offset = np.zeros(len(ts), dtype=bool)
+    for mask in (has_offset, ~has_offset):
+        if mask.any():
+            out[mask] = pd.to_datetime(ts[mask], utc=True, errors="coerce", format="ISO8601")
+    return out
+
 
 def to_utc_series(ts: pd.Series | Iterable[object]) -> pd.Series:
     """
@@ -55,8 +79,28 @@ def to_utc_series(ts: pd.Series | Iterable[object]) -> pd.Series:
         except Exception:
             return pd.NaT
 
-    s = ts.map(_one)
-    # Ensure dtype is datetime64[ns, UTC]
-    if not pd.api.types.is_datetime64tz_dtype(s):
-        s = pd.to_datetime(s, utc=True, errors="coerce")
+    # Most inputs are ISO 8601 text and parse in bulk; only what that pass could
+    # not read goes through the per-element parser.
+    try:
+        s = _parse_iso8601(ts)
+    except (TypeError, ValueError):
+        s = pd.Series(pd.NaT, index=ts.index, dtype="datetime64[ns, UTC]")
+    leftover = (s.isna() & ts.notna()).to_numpy(dtype=bool)
+    if leftover.any():
+        s[leftover] = pd.to_datetime(ts[leftover].map(_one), utc=True, errors="coerce")
     return s
+
+
+def sort_by_timestamp(df: pd.DataFrame, column: str = "timestamp") -> pd.DataFrame:
+    """Return ``df`` ordered by ``column`` with a fresh ``RangeIndex``.
+
+    Frames that are already time-ordered (the common case for logger exports)
+    skip the sort; the index is only rebuilt when it is not already ``0..n-1``.
+    """
+
+    if not df[column].is_monotonic_increasing:
+        return df.sort_values(column, kind="stable").reset_index(drop=True)
+    index = df.index
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        return df
+    return df.reset_index(drop=True)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pint
 
 
@@ -25,13 +26,44 @@ def to_quantity(value: Any, unit: str) -> pint.Quantity:
     return float(value) * ureg()(unit)
 
 
+@lru_cache(maxsize=256)
+def _scale_factor(src_unit: str, dst_unit: str) -> float | None:
+    """Return the multiplier from ``src_unit`` to ``dst_unit``; ``None`` for offset units."""
+
+    registry = ureg()
+    if (0.0 * registry(src_unit)).to(dst_unit).magnitude != 0.0:
+        return None
+    return (1.0 * registry(src_unit)).to(dst_unit).magnitude
+
+
 def convert_value(value: float, src_unit: str, dst_unit: str) -> float:
     """Convert ``value`` from ``src_unit`` to ``dst_unit``."""
 
+    factor = _scale_factor(src_unit, dst_unit)
+    if factor is not None:
+        return float(value) * factor
     quantity = float(value) * ureg()(src_unit)
     return quantity.to(dst_unit).magnitude
 
 
+def convert_array(values: Any, src_unit: str, dst_unit: str) -> np.ndarray:
+    """Convert a 1-D array of magnitudes from ``src_unit`` to ``dst_unit``.
+
+    Scale-only conversions are a single multiply; offset units (temperatures)
+    fall back to converting value by value.
+    """
+
+    array = np.asarray(values, dtype=float)
+    factor = _scale_factor(src_unit, dst_unit)
+    if factor is not None:
+        return array * factor
+    return np.fromiter(
+        (convert_value(value, src_unit, dst_unit) for value in array.tolist()),
+        dtype=float,
+        count=array.size,
+    )
+
+
 def normalize_temperature(value: float, unit: str, dst: str = "degC") -> float:
     """Normalize a temperature measurement to degrees Celsius."""
 
@@ -54,6 +86,7 @@ __all__ = [
     "ureg",
     "to_quantity",
     "convert_value",
+    "convert_array",
     "normalize_temperature",
     "normalize_massflow",
     "normalize_exhaust_flow",
@@ -109,6 +109,25 @@ def test_analysis_engine_computes_kpis_and_summary() -> None:
     assert "KPIs" in result.summary_md
 
 
+def test_analysis_engine_leaves_input_frame_untouched() -> None:
+    rules = load_rules({"speed_bins": [{"name": "urban", "max_kmh": 60}]})
+    engine = AnalysisEngine(rules)
+
+    ordered = _build_sample_df()
+    snapshot = ordered.copy()
+    result = engine.analyze(ordered)
+    pd.testing.assert_frame_equal(ordered, snapshot)
+    assert "delta_time_s" in result.derived.columns
+
+    result.derived.loc[result.derived.index[0], "veh_speed_m_s"] = 999.0
+    pd.testing.assert_frame_equal(ordered, snapshot)
+
+    shuffled = ordered.iloc[::-1]
+    derived = engine.analyze(shuffled).derived
+    assert derived["timestamp"].is_monotonic_increasing
+    assert derived.index.tolist() == list(range(len(shuffled)))
+
+
 def test_analysis_engine_normalizes_kpi_units() -> None:
     rules = load_rules(
         {
@@ -213,3 +232,25 @@ def test_load_rules_from_json(tmp_path: Path) -> None:
     rules = load_rules(config)
     assert rules.speed_bins[0].name == "demo"
     assert rules.completeness_max_gap_s == 2
+
+
+def test_compute_kpis_includes_metrics_registered_after_import(monkeypatch) -> None:
+    from src.app.analysis.metrics import REGISTRY, MetricDef, compute_distance_normalized_kpis
+
+    monkeypatch.setitem(
+        REGISTRY,
+        "NO2",
+        MetricDef(col="no2_mg_s", kind="mass_rate", out_key="NO2_mg_per_km", si_unit="mg/s"),
+    )
+    df = pd.DataFrame(
+        {
+            "delta_time_s": [1.0, 1.0],
+            "distance_increment_m": [500.0, 500.0],
+            "no2_mg_s": [2.0, 4.0],
+        }
+    )
+
+    kpis = compute_distance_normalized_kpis(df)
+
+    assert kpis["NO2_mg_per_km"]["label"] == "NO2 (mg/km)"
+    assert kpis["NO2_mg_per_km"]["total"]["value"] == pytest.approx(6.0)
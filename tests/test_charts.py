@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.app.analysis.charts import build_pollutant_chart
+
+
+def test_pollutant_chart_emits_none_for_missing_samples() -> None:
+    df = pd.DataFrame(
+        {
+            "timestamp": ["2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z"],
+            "nox_mg_s": [1.5, None],
+        }
+    )
+
+    chart = build_pollutant_chart(df)
+
+    assert chart["pollutants"] == [
+        {
+            "key": "NOx",
+            "unit": "mg/s",
+            "t": ["2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z"],
+            "y": [1.5, None],
+        }
+    ]
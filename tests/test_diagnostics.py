@@ -75,3 +75,17 @@ def test_speed_spike_detection():
     assert spike_check is not None
     assert spike_check.level == "warn"
     assert spike_check.count == 1
+
+
+def test_run_diagnostics_returns_independent_frame():
+    fused = pd.DataFrame(
+        {
+            "timestamp": ["2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z"],
+            "nox_mg_s": [1.0, 2.0],
+        }
+    )
+
+    repaired, _ = run_diagnostics(fused, {}, repair_small_gaps=False)
+    repaired.loc[0, "nox_mg_s"] = 999.0
+
+    assert fused["nox_mg_s"].tolist() == [1.0, 2.0]
@@ -15,7 +15,7 @@ from src.app.regulation.eu7ld_un168_limits import (
     RPA_LOW_SPEED_OFFSET,
     RPA_LOW_SPEED_SLOPE,
 )
-from src.app.rules.engine import evaluate_eu7_ld
+from src.app.rules.engine import evaluate_eu7_ld, load_spec
 
 
 def _payload(overrides: Mapping[str, Any] | None = None) -> dict[str, Any]:
@@ -181,3 +181,12 @@ def test_payload_emissions_and_values_numeric() -> None:
     values = [row["value"] for row in payload["criteria"] if row["value"] is not None]
     assert all(isinstance(value, (int, float)) for value in values)
 
+
+def test_load_spec_returns_independent_copies() -> None:
+    first = load_spec()
+    first["limits"] = {"mutated": True}
+
+    second = load_spec()
+
+    assert second["limits"] != {"mutated": True}
+    assert second is not first
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+
+from src.app.utils.jsonio import dumps, dumps_bytes, loads
+
+
+def test_dumps_handles_numpy_values_and_unicode() -> None:
+    payload = {
+        "series": np.array([1.5, 2.0]),
+        "count": np.int64(3),
+        "label": "NOₓ",
+    }
+
+    text = dumps(payload)
+
+    assert isinstance(text, str)
+    assert json.loads(text) == {"series": [1.5, 2.0], "count": 3, "label": "NOₓ"}
+    assert dumps_bytes(payload) == text.encode("utf-8")
+
+
+def test_loads_accepts_str_and_bytes() -> None:
+    assert loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert loads(b'{"a": null}') == {"a": None}
+
+
+def test_fast_json_response_renders_numpy_payload() -> None:
+    from src.app.ui.responses import FastJSONResponse
+
+    response = FastJSONResponse({"y": np.array([0.5, 1.25])})
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {"y": [0.5, 1.25]}
+
+
+def test_dumps_pretty_bytes_indents_and_sorts_keys() -> None:
+    from src.app.utils.jsonio import dumps_pretty_bytes
+
+    payload = {"b": [1, np.float64(2.5)], "a": {"z": None, "y": "NOₓ"}}
+
+    text = dumps_pretty_bytes(payload).decode("utf-8")
+
+    assert text == json.dumps(
+        {"b": [1, 2.5], "a": {"z": None, "y": "NOₓ"}}, ensure_ascii=False, indent=2, sort_keys=True
+    )
+
+
+def test_loads_accepts_stdlib_nan_tokens() -> None:
+    import math
+
+    data = loads(b'{"value": NaN, "other": 1.5}')
+
+    assert math.isnan(data["value"])
+    assert data["other"] == 1.5
+
+
+def test_stdlib_fallback_writes_null_for_non_finite_floats(monkeypatch) -> None:
+    from src.app.utils import jsonio
+
+    payload = {"nan": float("nan"), "inf": [np.inf, 1.5], "series": np.array([np.nan, 2.0])}
+    expected = '{"nan":null,"inf":[null,1.5],"series":[null,2.0]}'
+    if jsonio.orjson is not None:
+        assert jsonio.dumps(payload) == expected
+
+    monkeypatch.setattr(jsonio, "orjson", None)
+
+    assert jsonio.dumps(payload) == expected
+    assert jsonio.dumps_bytes(payload) == expected.encode("utf-8")
+    assert json.loads(jsonio.dumps_pretty_bytes(payload)) == json.loads(expected)
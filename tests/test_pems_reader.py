@@ -63,3 +63,54 @@ def test_pems_reader_rejects_ppm_to_massflow(tmp_path):
     message = str(excinfo.value)
     assert "ppm" in message
     assert "temperature" in message
+
+
+def test_pems_reader_reads_buffers_and_coerces_text_values():
+    import io
+
+    buffer = io.StringIO(
+        "timestamp,exhaust_flow_kg_s,nox_mg_s\n"
+        "2024-01-01T00:00:01Z,0.36,n/a\n"
+        "2024-01-01T00:00:00Z,0.35,12.5\n"
+    )
+
+    normalized = PEMSReader.from_csv(buffer)
+
+    assert normalized["exhaust_flow_kg_s"].tolist() == pytest.approx([0.35, 0.36])
+    assert normalized["nox_mg_s"].iloc[0] == pytest.approx(12.5)
+    assert pd.isna(normalized["nox_mg_s"].iloc[1])
+
+
+def test_read_pems_csv_accepts_text_streams():
+    import io
+
+    from src.app.data.ingestion.pems_reader import read_pems_csv
+
+    text = "timestamp,nox_mg_s\n2024-01-01T00:00:00Z,12.5\n"
+
+    assert read_pems_csv(io.StringIO(text)) == read_pems_csv(text)
+    assert read_pems_csv(io.StringIO(text)) == [
+        {"timestamp": "2024-01-01T00:00:00Z", "nox_mg_s": "12.5"}
+    ]
+    assert read_pems_csv(" \n") == []
+
+
+def test_pems_reader_keeps_inferred_dtypes_for_unconverted_columns():
+    normalized = PEMSReader.from_csv("data/samples/pems_demo.csv")
+
+    assert normalized["pn_1_s"].dtype == "int64"
+    assert normalized["exhaust_flow_kg_s"].dtype == "float64"
+
+
+def test_pems_reader_pyarrow_engine_fuses_with_gps():
+    pytest.importorskip("pyarrow")
+    from src.app.data.fusion import FusionEngine, StreamSpec
+    from src.app.data.ingestion import GPSReader
+
+    pems = PEMSReader.from_csv("data/samples/pems_demo.csv")
+    gps = GPSReader.from_csv("data/samples/gps_demo.csv")
+
+    assert pems["timestamp"].dtype == gps["timestamp"].dtype == "datetime64[ns, UTC]"
+
+    fused = FusionEngine(StreamSpec(df=gps, name="gps"), [StreamSpec(df=pems, name="pems")]).fuse()
+    assert fused["nox_mg_s_pems"].notna().any()
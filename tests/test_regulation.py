@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+
 from src.app.data.regulation import evaluate_pack, load_pack
 
 
@@ -67,3 +70,15 @@ def test_evaluate_pack_missing_metric_marks_failure() -> None:
     assert kpi_rule.passed is False
     assert kpi_rule.actual == 450.0
     assert kpi_rule.margin == -150.0
+
+
+def test_load_regulation_pack_caches_default_and_accepts_mappings() -> None:
+    from src.app.regulation import load_regulation_pack
+
+    assert load_regulation_pack() is load_regulation_pack()
+
+    raw = json.loads(Path("data/regpacks/eu7_demo.json").read_text(encoding="utf-8"))
+    raw["id"] = "custom"
+    custom = load_regulation_pack(raw)
+    assert custom.id == "custom"
+    assert load_regulation_pack().id == "eu7_demo"
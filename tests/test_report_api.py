@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 from fastapi.testclient import TestClient
@@ -36,3 +37,94 @@ def test_report_endpoint_returns_sample() -> None:
     assert results.get("conformity:nox") == "pass"
     assert len(payload["criteria"]) == 53
 
+
+def test_load_report_reuses_parsed_file_until_it_changes(tmp_path) -> None:
+    from src.app.reporting import eu7ld_report
+
+    raw = json.loads(Path("reports/sample.json").read_text(encoding="utf-8"))
+    path = eu7ld_report.save_report_json(ReportData.model_validate(raw), report_dir=tmp_path)
+
+    first = eu7ld_report.load_report("sample", report_dir=tmp_path)
+    cached = eu7ld_report._REPORT_CACHE[path][1]
+    assert eu7ld_report.load_report("sample", report_dir=tmp_path) == first
+    assert eu7ld_report._REPORT_CACHE[path][1] is cached
+
+    raw["meta"]["engine"] = "Updated engine"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert eu7ld_report.load_report("sample", report_dir=tmp_path).meta.engine == "Updated engine"
+
+
+def test_load_report_accepts_stdlib_nan_tokens(tmp_path) -> None:
+    import math
+
+    from src.app.reporting import eu7ld_report
+
+    raw = json.loads(Path("reports/sample.json").read_text(encoding="utf-8"))
+    raw["emissions"]["urban"]["CO2_g_km"] = float("nan")
+    (tmp_path / "sample.json").write_text(json.dumps(raw), encoding="utf-8")
+
+    report = eu7ld_report.load_report("sample", report_dir=tmp_path)
+
+    assert math.isnan(report.emissions.urban.CO2_g_km)
+
+
+def test_report_cache_evicts_least_recently_used(tmp_path, monkeypatch) -> None:
+    from src.app.reporting import eu7ld_report
+
+    monkeypatch.setattr(eu7ld_report, "_REPORT_CACHE_MAXSIZE", 1)
+    monkeypatch.setattr(eu7ld_report, "_REPORT_CACHE", {})
+    raw = json.loads(Path("reports/sample.json").read_text(encoding="utf-8"))
+    first = eu7ld_report.save_report_json(ReportData.model_validate(raw), report_dir=tmp_path)
+    raw["meta"]["testId"] = "second"
+    second = eu7ld_report.save_report_json(ReportData.model_validate(raw), report_dir=tmp_path)
+
+    eu7ld_report.load_report("sample", report_dir=tmp_path)
+    eu7ld_report.load_report("second", report_dir=tmp_path)
+
+    assert list(eu7ld_report._REPORT_CACHE) == [second]
+    assert first not in eu7ld_report._REPORT_CACHE
+
+
+def test_save_report_json_invalidates_cached_report(tmp_path) -> None:
+    from src.app.reporting import eu7ld_report
+
+    raw = json.loads(Path("reports/sample.json").read_text(encoding="utf-8"))
+    path = eu7ld_report.save_report_json(ReportData.model_validate(raw), report_dir=tmp_path)
+    eu7ld_report.load_report("sample", report_dir=tmp_path)
+    assert path in eu7ld_report._REPORT_CACHE
+
+    raw["meta"]["engine"] = "Saved engine"
+    eu7ld_report.save_report_json(ReportData.model_validate(raw), report_dir=tmp_path)
+
+    assert path not in eu7ld_report._REPORT_CACHE
+    assert eu7ld_report.load_report("sample", report_dir=tmp_path).meta.engine == "Saved engine"
+
+
+def test_write_report_archive_accepts_unseekable_sink(tmp_path, monkeypatch) -> None:
+    import io
+    import zipfile
+
+    from src.app.reporting import archive, eu7ld_report
+
+    monkeypatch.setattr(eu7ld_report, "_REPORT_DIR", tmp_path)
+
+    class _Sink:
+        def __init__(self) -> None:
+            self.chunks: list[bytes] = []
+
+        def write(self, data: bytes) -> int:
+            self.chunks.append(bytes(data))
+            return len(data)
+
+        def flush(self) -> None:
+            pass
+
+    sink = _Sink()
+    archive.write_report_archive({}, sink)
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(sink.chunks))) as bundle:
+        assert bundle.namelist() == ["index.html", "diagnostics.json", "report.json"]
+        assert bundle.testzip() is None
@@ -36,3 +36,29 @@ def test_to_utc_series_handles_mixed_inputs() -> None:
     )
 
     pd.testing.assert_series_equal(result, expected)
+
+
+def test_to_utc_series_keeps_naive_strings_utc_after_offset_values() -> None:
+    result = to_utc_series(
+        ["2023-01-01T02:00:00+02:00", "2023-01-01T00:00:05", "2023/01/01 00:00:06"]
+    )
+
+    assert result.tolist() == [
+        pd.Timestamp("2023-01-01T00:00:00Z"),
+        pd.Timestamp("2023-01-01T00:00:05Z"),
+        pd.Timestamp("2023-01-01T00:00:06Z"),
+    ]
+
+
+def test_sort_by_timestamp_skips_sorted_frames() -> None:
+    from src.app.utils import sort_by_timestamp
+
+    ordered = pd.DataFrame({"timestamp": [1, 2, 3], "value": [1.0, 2.0, 3.0]})
+    assert sort_by_timestamp(ordered) is ordered
+
+    shuffled = pd.DataFrame(
+        {"timestamp": [3, 1, 2], "value": [3.0, 1.0, 2.0]}, index=[10, 11, 12]
+    )
+    result = sort_by_timestamp(shuffled)
+    assert result["timestamp"].tolist() == [1, 2, 3]
+    assert result.index.tolist() == [0, 1, 2]
@@ -76,6 +76,25 @@ def test_index_page_renders() -> None:
     assert "Upload PEMS, GPS, and ECU" in response.text
 
 
+def test_index_page_embeds_canonical_schema() -> None:
+    html = client.get("/").text
+    marker = '<script type="application/json" id="canonical-schema">'
+    start = html.index(marker) + len(marker)
+    schema = json.loads(html[start : html.index("</script>", start)])
+    assert {entry["key"] for entry in schema["datasets"]} >= {"pems", "gps", "ecu"}
+
+
+def test_index_page_supports_conditional_get() -> None:
+    first = client.get("/")
+    etag = first.headers.get("etag")
+    assert etag
+    assert "max-age" in first.headers.get("cache-control", "")
+
+    cached = client.get("/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
 def test_static_assets_served() -> None:
     response = client.get("/static/css/styles.css")
     assert response.status_code == 200
@@ -182,6 +201,18 @@ def test_results_payload_embedded_in_html() -> None:
     assert sum(1 for item in payload["criteria"] if isinstance(item.get("value"), (int, float))) >= 40
 
 
+def test_analyze_rejects_oversized_upload(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.app.ui.routes import analyze as analyze_routes
+
+    monkeypatch.setattr(analyze_routes, "MAX_UPLOAD_BYTES", 16)
+    response = client.post(
+        "/analyze",
+        files={"pems_file": ("pems.csv", PEMS_SAMPLE.encode("utf-8"), "text/csv")},
+        headers={"accept": "application/json"},
+    )
+    assert response.status_code == 413
+
+
 def test_analyze_demo_route_renders_results() -> None:
     response = client.get("/analyze", params={"demo": 1})
     assert response.status_code == 200
@@ -206,6 +237,16 @@ def test_sample_file_downloads() -> None:
         assert "timestamp" in response.text
 
 
+def test_sample_file_download_delegates_to_proxy(monkeypatch) -> None:
+    from src.app.ui.routes import samples
+
+    monkeypatch.setattr(samples, "XACCEL_PREFIX", "/_samples/")
+    response = client.get("/samples/gps_demo.csv")
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == "/_samples/gps_demo.csv"
+    assert response.content == b""
+
+
 def test_samples_zip_download() -> None:
     response = client.get("/samples.zip")
     assert response.status_code == 200
@@ -218,6 +259,9 @@ def test_samples_zip_download() -> None:
             "pems_demo.csv",
         ]
 
+    cached = client.get("/samples.zip", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
 
 def test_export_zip_stream_download() -> None:
     response = client.get("/export_zip")
@@ -231,6 +275,7 @@ def test_export_zip_stream_download() -> None:
             "gps_demo.csv",
             "pems_demo.csv",
         ]
+        assert archive.testzip() is None
 
 
 def test_export_zip_json_mode() -> None:
@@ -256,6 +301,14 @@ def test_export_pdf_requires_payload() -> None:
     assert response.json()["detail"] == "Results payload is required."
 
 
+def test_export_pdf_rejects_malformed_json_body() -> None:
+    response = client.post(
+        "/export_pdf", content=b"{not json", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Request body must be valid JSON."
+
+
 @pytest.mark.skipif(not WEASYPRINT_AVAILABLE, reason="WeasyPrint not installed")
 def test_export_pdf_generates_document() -> None:
     payload = _post_analysis_json()
@@ -280,3 +333,37 @@ def test_results_payload_script_precedes_bundle() -> None:
     bundle_index = html.find("/static/js/app.js")
     assert payload_index != -1 and bundle_index != -1
     assert payload_index < bundle_index
+
+
+def test_static_files_prefer_precompressed_sibling(tmp_path: Path) -> None:
+    import gzip
+
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+
+    from src.app.ui.static_files import PrecompressedStaticFiles
+
+    source = b"console.log('hello');\n" * 50
+    (tmp_path / "app.js").write_bytes(source)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(source))
+    (tmp_path / "plain.css").write_text("body{}")
+    static_app = Starlette(
+        routes=[Mount("/static", PrecompressedStaticFiles(directory=str(tmp_path)))]
+    )
+    static_client = TestClient(static_app)
+
+    response = static_client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "javascript" in response.headers["content-type"]
+    assert response.content == source
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    identity = static_client.get("/static/app.js", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+    assert identity.content == source
+
+    plain = static_client.get("/static/plain.css", headers={"Accept-Encoding": "gzip"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers